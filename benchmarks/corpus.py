@@ -0,0 +1,55 @@
+import random
+
+# Synthetic, reproducible corpus of chemical formulas for benchmarks: flat formulas (e. g. "C6H12O6"),
+# bracketed formulas (e. g. "[Cu(NH3)4]SO4.H2O") and deeply nested formulas
+
+ORGANIC_ELEMENTS = ["N", "O", "S", "P", "F", "Cl", "Br", "I", "Si", "B"]
+INORGANIC_ELEMENTS = ["Na", "K", "Mg", "Ca", "Fe", "Cu", "Zn", "Al", "Co", "Ni", "Mn", "Cr", "U", "Tc"]
+BRACKETS = [("(", ")"), ("[", "]"), ("{", "}")]
+
+
+def _frequency(rng, maximum):
+    frequency = rng.randint(1, maximum)
+    return "" if frequency == 1 else str(frequency)
+
+
+# e. g. "C12H22O11" or "CH3NO2"
+def flat_formula(rng):
+    formula = "C" + _frequency(rng, 40) + "H" + _frequency(rng, 80)
+    for element in rng.sample(ORGANIC_ELEMENTS, rng.randint(0, 3)):
+        formula += element + _frequency(rng, 6)
+    return formula
+
+
+# e. g. "[Cu(NH3)4]SO4.5H2O" or "Ca(UO2)2(SiO3OH)2.(H2O)5"
+def bracketed_formula(rng):
+    formula = rng.choice(INORGANIC_ELEMENTS) + _frequency(rng, 3)
+    for _ in range(rng.randint(1, 3)):
+        opening, closing = rng.choice(BRACKETS)
+        unit = rng.choice(["NH3", "CN", "OH", "H2O", "SO4", "NO3", "CO3", "PO4", "CH3", "C2H5"])
+        formula += opening + unit + closing + _frequency(rng, 6)
+    if rng.random() < 0.3:
+        formula += ".(H2O)" + _frequency(rng, 10)
+    return formula
+
+
+# e. g. "((((CH2)2O)3N)2Si)4", depth brackets deep
+def nested_formula(rng, depth=12):
+    formula = "CH2"
+    for level in range(depth):
+        opening, closing = BRACKETS[level % len(BRACKETS)]
+        formula = opening + formula + rng.choice(["", "O", "N", "S"]) + closing + _frequency(rng, 4)
+    return formula
+
+
+# Generates size formulas of the requested kind ("flat", "bracketed", "nested" or "mixed"), the corpus
+# only depends on size, kind and seed
+def generate(size, kind="mixed", seed=42):
+    rng = random.Random(seed)
+    generators = {
+        "flat": [flat_formula],
+        "bracketed": [bracketed_formula],
+        "nested": [nested_formula],
+        "mixed": [flat_formula] * 6 + [bracketed_formula] * 3 + [nested_formula],
+    }[kind]
+    return [rng.choice(generators)(rng) for _ in range(size)]
@@ -0,0 +1,238 @@
+"""
+Benchmark suite for the hot paths of ChemFormula (parsing, rendering, sorting, comparing and weights).
+
+Usage (from the repository root):
+
+    python benchmarks/run_benchmarks.py                            # run all benchmarks
+    python benchmarks/run_benchmarks.py --save baseline.json       # store the results as a baseline
+    python benchmarks/run_benchmarks.py --compare baseline.json    # flag regressions against a baseline
+
+Timings are given per formula (best of --repeat runs on a fixed synthetic corpus). A benchmark is
+flagged as a regression if it is slower than the baseline by more than --tolerance (default: 20 %),
+in which case the script exits with status 1. Absolute timings are only comparable on the same
+machine, so every machine needs its own baseline: if the platform recorded in the baseline differs
+from the current one, a warning is printed and regressions do not change the exit status.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+import corpus
+
+from chemformula import ChemFormula, hill_many, weight_many
+
+BENCHMARKS = {}
+
+
+# Registers a benchmark: setup(formulas) prepares the (untimed) input, run(state) is timed
+def benchmark(name, setup):
+    def register(run):
+        BENCHMARKS[name] = (setup, run)
+        return run
+    return register
+
+
+def _strings(formulas):
+    return list(formulas)
+
+
+def _objects(formulas):
+    return [ChemFormula(formula) for formula in formulas]
+
+
+def _pairs(formulas):
+    objects = _objects(formulas)
+    return list(zip(objects, objects[1:] + objects[:1]))
+
+
+def _flat(formulas):
+    return corpus.generate(len(formulas), "flat")
+
+
+def _bracketed(formulas):
+    return corpus.generate(len(formulas), "bracketed")
+
+
+def _nested(formulas):
+    return corpus.generate(len(formulas), "nested")
+
+
+@benchmark("parse (flat)", _flat)
+def _parse(formulas):
+    for formula in formulas:
+        ChemFormula(formula)
+
+
+benchmark("parse (bracketed)", _bracketed)(_parse)
+benchmark("parse (nested)", _nested)(_parse)
+
+
+@benchmark("format_formula", _objects)
+def _format_formula(objects):
+    return [formula.format_formula("--> ", "", "", "_<", ">", " <--", "", "", " * ") for formula in objects]
+
+
+@benchmark("latex", _objects)
+def _latex(objects):
+    return [formula.latex for formula in objects]
+
+
+@benchmark("html", _objects)
+def _html(objects):
+    return [formula.html for formula in objects]
+
+
+@benchmark("unicode", _objects)
+def _unicode(objects):
+    return [formula.unicode for formula in objects]
+
+
+@benchmark("sorted", _objects)
+def _sorted(objects):
+    return sorted(objects)
+
+
+@benchmark("__eq__", _pairs)
+def _eq(pairs):
+    return [left == right for left, right in pairs]
+
+
+@benchmark("formula_weight", _objects)
+def _formula_weight(objects):
+    return [formula.formula_weight for formula in objects]
+
+
+@benchmark("mass_fraction", _objects)
+def _mass_fraction(objects):
+    return [formula.mass_fraction for formula in objects]
+
+
+def _objects_with_mass_fractions(formulas):
+    objects = _objects(formulas)
+    _mass_fraction(objects)
+    return objects
+
+
+def _objects_with_sort_keys(formulas):
+    objects = _objects(formulas)
+    _sorted(objects)
+    return objects
+
+
+benchmark("mass_fraction (repeated)", _objects_with_mass_fractions)(_mass_fraction)
+benchmark("sorted (repeated)", _objects_with_sort_keys)(_sorted)
+
+
+@benchmark("sorted (hill_sort_key)", _objects)
+def _sorted_by_hill_sort_key(objects):
+    return sorted(objects, key=lambda formula: formula.hill_sort_key)
+
+
+@benchmark("hill_many", _strings)
+def _hill_many(formulas):
+    return hill_many(formulas)
+
+
+@benchmark("weight_many", _strings)
+def _weight_many(formulas):
+    return weight_many(formulas)
+
+
+# Returns the details of the current machine and Python interpreter, which are recorded in a baseline
+def platform_details():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "node": platform.node(),
+    }
+
+
+# Returns the platform details, which differ between a baseline and the current platform
+def platform_mismatches(baseline):
+    return [key for key, value in platform_details().items() if baseline.get(key) != value]
+
+
+# Runs all benchmarks and returns the best time per formula for each benchmark
+def run(size, repeat):
+    formulas = corpus.generate(size)
+    results = {}
+    for name, (setup, function) in BENCHMARKS.items():
+        timings = []
+        for _ in range(repeat):
+            state = setup(formulas)  # fresh objects for every run, so that memoized values are not reused
+            gc.disable()  # as in timeit, garbage collection is disabled during the timed run
+            try:
+                start = time.perf_counter()
+                function(state)
+                timings.append(time.perf_counter() - start)
+            finally:
+                gc.enable()
+        results[name] = min(timings) / size
+    return results
+
+
+# Compares results with baseline results, returns the names of all regressions
+def compare(results, baseline, tolerance):
+    regressions = []
+    print(f"\n{'benchmark':<26} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for name, seconds in results.items():
+        if name not in baseline:
+            print(f"{name:<26} {'-':>12} {seconds * 1e6:>10.2f}us {'-':>8}")
+            continue
+        ratio = seconds / baseline[name]
+        flag = "  REGRESSION" if ratio > 1 + tolerance else ""
+        print(f"{name:<26} {baseline[name] * 1e6:>10.2f}us {seconds * 1e6:>10.2f}us {ratio:>7.2f}x{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark suite for ChemFormula")
+    parser.add_argument("--size", type=int, default=5000, help="number of formulas in the corpus")
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs per benchmark (best run is used)")
+    parser.add_argument("--save", type=Path, help="store the results as a JSON baseline file")
+    parser.add_argument("--compare", type=Path, help="compare the results with a JSON baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown before flagging a regression")
+    arguments = parser.parse_args(argv)
+
+    results = run(arguments.size, arguments.repeat)
+    if arguments.compare:
+        baseline = json.loads(arguments.compare.read_text(encoding="utf-8"))
+        if baseline["size"] != arguments.size:
+            print(f"Warning: baseline corpus size {baseline['size']} differs from {arguments.size}", file=sys.stderr)
+        regressions = compare(results, baseline["results"], arguments.tolerance)
+        mismatches = platform_mismatches(baseline)
+        if mismatches:
+            print(f"Warning: baseline was measured on a different platform ({', '.join(mismatches)}), "
+                  "timings are not comparable and regressions are ignored", file=sys.stderr)
+            regressions = []
+    else:
+        regressions = []
+        print(f"\n{'benchmark':<26} {'time per formula':>18}")
+        for name, seconds in results.items():
+            print(f"{name:<26} {seconds * 1e6:>16.2f}us")
+    if arguments.save:
+        try:
+            chemformula_version = version("chemformula")
+        except PackageNotFoundError:
+            chemformula_version = "unknown"
+        arguments.save.write_text(json.dumps({
+            "chemformula": chemformula_version,
+            **platform_details(),
+            "size": arguments.size,
+            "results": results,
+        }, indent=2) + "\n", encoding="utf-8")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,2 +1,44 @@
-﻿__all__ = ["ChemFormula"]
-from .chemformula import ChemFormula
+﻿__all__ = [
+    "ChemFormula",
+    "ChemFormulaBatch",
+    "FormulaElementIndex",
+    "FormulaError",
+    "FormulaMassIndex",
+    "clear_parse_cache",
+    "composition",
+    "composition_many",
+    "decompose_mass",
+    "disable_parse_cache",
+    "enable_parse_cache",
+    "hill",
+    "hill_many",
+    "isotope_patterns",
+    "parse_cache_info",
+    "render_many",
+    "validate_cas_numbers",
+    "validate_many",
+    "weight",
+    "weight_many",
+]
+from .batch import ChemFormulaBatch
+from .cache import (
+    clear_parse_cache,
+    disable_parse_cache,
+    enable_parse_cache,
+    parse_cache_info,
+)
+from .casnumbers import validate_cas_numbers
+from .chemformula import ChemFormula, render_many
+from .decomposition import decompose_mass
+from .elementindex import FormulaElementIndex
+from .functional import (
+    composition,
+    composition_many,
+    hill,
+    hill_many,
+    weight,
+    weight_many,
+)
+from .isotopes import isotope_patterns
+from .massindex import FormulaMassIndex
+from .parser import FormulaError, validate_many
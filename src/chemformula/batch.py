@@ -0,0 +1,113 @@
+from . import elements
+from .chemformula import ChemFormula
+from .parser import parse_composition
+
+
+# NumPy is an optional dependency and only required for batch processing
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError(
+            "ChemFormulaBatch requires NumPy (install it with 'pip install chemformula[numpy]')"
+        ) from error
+    return numpy
+
+
+# Class for many chemical formulas, whose compositions are stored as one dense count matrix
+# with one row per formula and one column per element (in order of the atomic number)
+class ChemFormulaBatch:
+    symbols = elements.element_symbols
+    _column = {symbol: column for column, symbol in enumerate(symbols)}
+
+    def __init__(self, formulas, charges=None):
+        numpy = _import_numpy()
+        self.__formulas = tuple(str(formula) for formula in formulas)
+        if charges is None:
+            charges = [0] * len(self.__formulas)
+        else:
+            charges = list(charges)
+            if len(charges) != len(self.__formulas):
+                raise ValueError(
+                    f"Invalid Number of Charges (expected {len(self.__formulas)} charges, but found {len(charges)})"
+                )
+            for charge in charges:
+                if not isinstance(charge, int):
+                    raise TypeError(
+                        f"Invalid Charge Value '{charge}' (expected an integer (<class 'int'>), but found {type(charge)})"
+                    )
+        self.__charges = numpy.array(charges, dtype=numpy.int64)
+        # collect (row, column, frequency) triples of all formulas and fill the count matrix at once
+        rows, columns, frequencies = [], [], []
+        for row, formula in enumerate(self.__formulas):
+            for index, freq in parse_composition(formula):
+                rows.append(row)
+                columns.append(index)
+                frequencies.append(freq)
+        self.__counts = numpy.zeros((len(self.__formulas), len(self.symbols)), dtype=numpy.int64)
+        self.__counts[rows, columns] = frequencies
+        self.__counts.flags.writeable = False
+        self.__charges.flags.writeable = False
+        self.__atomic_weights = numpy.array(
+            [elements.element_table[symbol].atomic_weight for symbol in self.symbols], dtype=numpy.float64
+        )
+        self.__atomic_weights.flags.writeable = False
+        self.__formula_weight = None
+
+    # Returns the number of formulas in the batch
+    def __len__(self):
+        return len(self.__formulas)
+
+    # Returns the formula at position index as a ChemFormula object
+    def __getitem__(self, index):
+        return ChemFormula(self.__formulas[index], int(self.__charges[index]))
+
+    # Returns the original input formulas
+    @property
+    def formulas(self):
+        return self.__formulas
+
+    # Returns the charges of all formulas as an integer array
+    @property
+    def charges(self):
+        return self.__charges
+
+    # Returns the (read-only) count matrix with one row per formula and one column per element symbol
+    @property
+    def counts(self):
+        return self.__counts
+
+    # Returns the atomic weights in the column order of the count matrix, atomic weights are taken from elements.py
+    @property
+    def atomic_weights(self):
+        return self.__atomic_weights
+
+    # Returns the frequencies of one element for all formulas
+    def element(self, symbol):
+        if symbol not in self._column:
+            raise ValueError(
+                f"Invalid Element Symbol (unknown element symbol '{symbol}')"
+            )
+        return self.__counts[:, self._column[symbol]]
+
+    # Returns the formula weights of all formulas (matrix-vector product of counts and atomic weights)
+    @property
+    def formula_weight(self):
+        if self.__formula_weight is None:
+            self.__formula_weight = self.__counts @ self.atomic_weights
+            self.__formula_weight.flags.writeable = False
+        return self.__formula_weight
+
+    # Returns the mass fractions of all elements (columns) for all formulas (rows)
+    @property
+    def mass_fraction(self):
+        numpy = _import_numpy()
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            return (self.__counts * self.atomic_weights) / self.formula_weight[:, numpy.newaxis]
+
+    # Checks for all formulas, whether they contain an element classified as radioactive
+    @property
+    def radioactive(self):
+        numpy = _import_numpy()
+        radioactive_columns = numpy.array([elements.element_table[symbol].radioactive for symbol in self.symbols])
+        return self.__counts[:, radioactive_columns].any(axis=1)
@@ -0,0 +1,88 @@
+import os
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .chemformula import ChemFormula
+
+# Compact and picklable parse result of one formula string: the composition as a tuple of
+# (element symbol, element frequency) pairs, the Hill formula and the formula weight, or an error message
+ParseResult = namedtuple("ParseResult", ["formula", "composition", "hill_formula", "formula_weight", "error"])
+
+
+# Parses one formula string, invalid formulas are reported in the error field instead of raising an exception
+def _parse_one(formula):
+    try:
+        chemical_formula = ChemFormula(formula)
+    except ValueError as error:
+        return ParseResult(formula, None, None, None, str(error))
+    return ParseResult(formula,
+                       tuple(chemical_formula.element.items()),
+                       str(chemical_formula.hill_formula),
+                       chemical_formula.formula_weight,
+                       None)
+
+
+# Parses a chunk of formula strings (executed in the worker processes)
+def _parse_chunk(formulas):
+    return [_parse_one(formula) for formula in formulas]
+
+
+# Reads formula strings from a file path or a file object (one formula per line, empty lines are skipped)
+def read_formulas(source):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as formula_file:
+            yield from read_formulas(formula_file)
+        return
+    for line in source:
+        formula = line.strip()
+        if formula:
+            yield formula
+
+
+# Splits an iterable of formula strings into lists of chunksize formulas
+def chunks(formulas, chunksize):
+    iterator = iter(formulas)
+    while chunk := list(islice(iterator, chunksize)):
+        yield chunk
+
+
+# Parses formula strings from a file (path) or an iterable across jobs worker processes and yields
+# one ParseResult per formula in input order, jobs=None uses all CPUs and jobs=1 parses in the current process;
+# if cache is the path of a persistent parse cache (see persistentcache.py), cached formulas are not parsed again
+# and new parse results are added to the cache
+def parse_bulk(source, jobs=None, chunksize=1000, cache=None):
+    if not isinstance(chunksize, int) or chunksize < 1:
+        raise ValueError(
+            f"Invalid Chunk Size '{chunksize}' (expected a positive integer)"
+        )
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if not isinstance(jobs, int) or jobs < 1:
+        raise ValueError(
+            f"Invalid Number of Jobs '{jobs}' (expected a positive integer)"
+        )
+    formulas = read_formulas(source) if isinstance(source, (str, os.PathLike)) else source
+    if cache is not None:
+        # imported on first use, since the persistent cache module imports this module
+        from .persistentcache import parse_chunks
+        return parse_chunks(chunks(formulas, chunksize), jobs, cache)
+    return map_chunks(_parse_chunk, chunks(formulas, chunksize), jobs)
+
+
+# Applies function to every chunk across jobs worker processes and yields the items of the returned lists
+# in input order, function must be picklable (e. g. a module-level function or a functools.partial object)
+def map_chunks(function, chunks, jobs):
+    if jobs == 1:
+        for chunk in chunks:
+            yield from function(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # keep a bounded number of chunks in flight, so that memory use does not depend on the size of the input
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(function, chunk))
+            if len(pending) >= 2 * jobs:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,98 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+# Statistics of the parse cache (same fields as functools.lru_cache's cache_info())
+ParseCacheInfo = namedtuple("ParseCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+# Size-bounded least recently used (LRU) cache, a maxsize of 0 disables the cache
+class LRUCache:
+    def __init__(self, maxsize=0):
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.maxsize = maxsize
+
+    # Returns the maximum number of entries
+    @property
+    def maxsize(self):
+        return self.__maxsize
+
+    # Checks, whether the maximum number of entries is valid, and removes the least recently used entries if necessary
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool):
+            raise TypeError(
+                f"Invalid Cache Size '{maxsize}' (expected an integer (<class 'int'>), but found {type(maxsize)})"
+            )
+        if maxsize < 0:
+            raise ValueError(
+                f"Invalid Cache Size '{maxsize}' (expected a non-negative integer)"
+            )
+        with self.__lock:
+            self.__maxsize = maxsize
+            while len(self.__entries) > maxsize:
+                self.__entries.popitem(last=False)
+
+    # Returns the cached value for key or None, if the key is not cached
+    def get(self, key):
+        with self.__lock:
+            value = self.__entries.get(key)
+            if value is None:
+                self.__misses += 1
+            else:
+                self.__hits += 1
+                self.__entries.move_to_end(key)
+            return value
+
+    # Stores value for key and removes the least recently used entry if the cache is full
+    def put(self, key, value):
+        with self.__lock:
+            if self.__maxsize == 0:
+                return
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            if len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+
+    # Removes all entries and resets the statistics
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+    # Returns the cache statistics
+    def info(self):
+        with self.__lock:
+            return ParseCacheInfo(self.__hits, self.__misses, self.__maxsize, len(self.__entries))
+
+
+# Parse results (compositions) keyed by the raw formula string, disabled by default
+parse_cache = LRUCache()
+
+
+# Enables the parse cache with a maximum of maxsize formulas or resizes an already enabled parse cache
+def enable_parse_cache(maxsize=4096):
+    if maxsize == 0:
+        raise ValueError(
+            "Invalid Cache Size '0' (use disable_parse_cache() to disable the parse cache)"
+        )
+    parse_cache.maxsize = maxsize
+
+
+# Disables the parse cache and removes all entries
+def disable_parse_cache():
+    parse_cache.maxsize = 0
+    parse_cache.clear()
+
+
+# Removes all entries from the parse cache and resets its statistics
+def clear_parse_cache():
+    parse_cache.clear()
+
+
+# Returns hits, misses, maxsize and currsize of the parse cache
+def parse_cache_info():
+    return parse_cache.info()
@@ -0,0 +1,74 @@
+import re
+from collections import namedtuple
+
+from .cache import LRUCache
+
+# Result of the validation of one CAS registry number: the input value, the CAS object (None if invalid or missing)
+# and the error message (None if valid or missing)
+CASResult = namedtuple("CASResult", ["value", "cas", "error"])
+
+# Canonical formatted strings (without leading zeros) of validated CAS registry numbers keyed by the CAS registry
+# number as an integer, every formula object gets its own CAS object, so that changing the CAS object of one formula
+# does not affect other formulas
+cas_cache = LRUCache(maxsize=4096)
+
+# Formatted CAS registry number (_____00-00-0)
+_CAS_STRING = re.compile(r"(\d{2,7})-(\d{2})-(\d)")
+
+
+# The casregnum package is imported on first use, so that importing chemformula does not load it
+def _cas_class():
+    import casregnum
+    return casregnum.CAS
+
+
+# Returns a CAS registry number given as an integer or a formatted string as an integer, or None for other input
+def _normalize_cas(cas_rn):
+    if isinstance(cas_rn, int) and not isinstance(cas_rn, bool):
+        return cas_rn
+    if isinstance(cas_rn, str) and (match := _CAS_STRING.fullmatch(cas_rn)):
+        return int("".join(match.groups()))
+    return None
+
+
+# Returns the canonical formatted string of a CAS registry number given as an integer or a string (cached),
+# raises a TypeError or ValueError for invalid CAS registry numbers
+def cas_string(cas_rn):
+    cas_integer = _normalize_cas(cas_rn)
+    if cas_integer is None:
+        # raises a TypeError or ValueError for invalid CAS registry numbers
+        return _cas_class()(_cas_class()(cas_rn).cas_integer).cas_string
+    string = cas_cache.get(cas_integer)
+    if string is None:
+        # the input is validated, the cached string is rebuilt from the integer, so that it does not depend on
+        # the notation of the first input (e. g. leading zeros)
+        string = _cas_class()(_cas_class()(cas_rn).cas_integer).cas_string
+        cas_cache.put(cas_integer, string)
+    return string
+
+
+# Returns a CAS registry number given as an integer or a string as an integer (cached),
+# raises a TypeError or ValueError for invalid CAS registry numbers
+def cas_integer(cas_rn):
+    return int(cas_string(cas_rn).replace("-", ""))
+
+
+# Returns a new casregnum.CAS object of a CAS registry number given as an integer or a string,
+# raises a TypeError or ValueError for invalid CAS registry numbers
+def get_cas(cas_rn):
+    return _cas_class()(cas_string(cas_rn))
+
+
+# Validates many CAS registry numbers (e. g. a column of a table) and returns one CASResult per value,
+# missing values (None or empty strings) are returned without CAS object and without error message
+def validate_cas_numbers(values):
+    results = []
+    for value in values:
+        if value is None or value == "":
+            results.append(CASResult(value, None, None))
+            continue
+        try:
+            results.append(CASResult(value, get_cas(value), None))
+        except (TypeError, ValueError) as error:
+            results.append(CASResult(value, None, str(error)))
+    return results
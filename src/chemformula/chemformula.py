@@ -1,20 +1,152 @@
 import re
-from collections import defaultdict
+from time import perf_counter
+
+from . import elements, isotopes, profiling
+from .casnumbers import cas_integer, cas_string, get_cas
+from .parser import intern_composition, parse_composition
+
+# Single-pass tokenizer for formatted output: brackets, element symbols, element frequencies, multiply symbols
+# and any other single character
+_FORMAT_TOKENS = re.compile(r"[\{\[\(\)\]\}]|[A-Z][a-z]?|\d+|[\.\*]|.", re.DOTALL)
+# Formatting affixes are replacement templates (e. g. r"\\" for a backslash), they are expanded once per renderer
+_TEMPLATE_ANCHOR = re.compile(r"\A")
+# maximum number of formatted tokens kept per renderer
+_MAX_FORMATTED_TOKENS = 4096
+
+# Element symbols and Element records, indexed by the element index of a composition
+_ELEMENT_SYMBOLS = elements.element_symbols
+_ELEMENT_RECORDS = tuple(elements.element_table.values())
+
+_SUBSCRIPT_DIGITS = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+_SUPERSCRIPT_CHARGE = str.maketrans("0123456789+-", "⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻")
+
+
+# Returns the (element symbol, element frequency) pairs of a composition, i. e. a tuple of (element index,
+# element frequency) pairs, in Hill sorting
+def hill_composition(composition):
+    dict_sorted_elements = dict(sorted((_ELEMENT_SYMBOLS[index], freq) for index, freq in composition))
+    dict_hill_sorted_elements = {}
+    # extract "C" and "H" (if "C" is also present) from the original dictionary
+    if "C" in dict_sorted_elements:
+        dict_hill_sorted_elements["C"] = dict_sorted_elements.pop("C")
+        if "H" in dict_sorted_elements:
+            dict_hill_sorted_elements["H"] = dict_sorted_elements.pop("H")
+    # place "C" and "H" (if "C" is also present) in front of all other elements
+    dict_hill_sorted_elements.update(dict_sorted_elements)
+    return tuple(dict_hill_sorted_elements.items())
+
+
+# Dictionary of formatted tokens, tokens are formatted on first use and then looked up
+class _FormattedTokens(dict):
+    def __init__(self, element_affixes, freq_affixes, bracket_affixes, multiply_symbol):
+        super().__init__()
+        self.__element_affixes = element_affixes
+        self.__freq_affixes = freq_affixes
+        self.__bracket_affixes = bracket_affixes
+        self.__multiply_symbol = multiply_symbol
+
+    def __missing__(self, token):
+        if "A" <= token[0] <= "Z":
+            formatted_token = self.__element_affixes[0] + token + self.__element_affixes[1]
+        elif token.isdecimal():
+            formatted_token = self.__freq_affixes[0] + token + self.__freq_affixes[1]
+        elif token in "{[()]}":
+            formatted_token = self.__bracket_affixes[0] + token + self.__bracket_affixes[1]
+        elif token in ".*":
+            formatted_token = self.__multiply_symbol
+        else:
+            formatted_token = token
+        if len(self) < _MAX_FORMATTED_TOKENS:
+            self[token] = formatted_token
+        return formatted_token
+
+
+# Renders formula strings with one set of formatting options (see ChemFormulaString.format_formula)
+class _FormulaRenderer:
+    def __init__(self,
+                 formula_prefix="",
+                 element_prefix="", element_suffix="",
+                 freq_prefix="", freq_suffix="",
+                 formula_suffix="",
+                 bracket_prefix="", bracket_suffix="",
+                 multiply_symbol="",
+                 charge_prefix="", charge_suffix=""
+                 ):
+        def expand(template):
+            return _TEMPLATE_ANCHOR.sub(template, "")
+        self.__formula_prefix = formula_prefix
+        self.__formula_suffix = formula_suffix
+        self.__charge_prefix = charge_prefix
+        self.__charge_suffix = charge_suffix
+        self.__tokens = _FormattedTokens((expand(element_prefix), expand(element_suffix)),
+                                         (expand(freq_prefix), expand(freq_suffix)),
+                                         (expand(bracket_prefix), expand(bracket_suffix)),
+                                         expand(multiply_symbol))
+
+    # Renders a formula from its tokens (see _FORMAT_TOKENS) and its charge text
+    def render(self, tokens, text_charge):
+        formatted_formula = "".join(map(self.__tokens.__getitem__, tokens))
+        if text_charge:
+            return (self.__formula_prefix + formatted_formula
+                    + self.__charge_prefix + text_charge + self.__charge_suffix + self.__formula_suffix)
+        else:
+            return self.__formula_prefix + formatted_formula + self.__formula_suffix
 
-import casregnum
 
-from . import elements
+_LATEX_RENDERER = _FormulaRenderer("",
+                                   r"\\textnormal{", "}",
+                                   "_{", "}",
+                                   "",
+                                   r"\\",
+                                   multiply_symbol=r"\\cdot",
+                                   charge_prefix="^{", charge_suffix="}"
+                                   )
+
+_HTML_RENDERER = _FormulaRenderer("<span class='ChemFormula'>",
+                                  "", "",
+                                  "<sub>", "</sub>",
+                                  "</span>",
+                                  multiply_symbol="&sdot;",
+                                  charge_prefix="<sup>", charge_suffix="</sup>"
+                                  )
+
+
+# Renders many formulas (ChemFormulaString objects or strings) in one call, output is one of "text", "latex", "html"
+# and "unicode" or a tuple of these, in which case each formula is tokenized once and a tuple of renderings is returned
+def render_many(formulas, output="html"):
+    outputs = (output,) if isinstance(output, str) else tuple(output)
+    for item in outputs:
+        if item not in ("text", "latex", "html", "unicode"):
+            raise ValueError(
+                f"Invalid Output Format '{item}' (expected 'text', 'latex', 'html' or 'unicode')"
+            )
+    renderings = []
+    for formula in formulas:
+        if not isinstance(formula, ChemFormulaString):
+            formula = ChemFormulaString(formula)
+        text_charge = formula.text_charge
+        tokens = _FORMAT_TOKENS.findall(formula.formula) if ("latex" in outputs or "html" in outputs) else None
+        rendering = []
+        for item in outputs:
+            if item == "html":
+                rendering.append(_HTML_RENDERER.render(tokens, text_charge))
+            elif item == "latex":
+                rendering.append(_LATEX_RENDERER.render(tokens, text_charge))
+            elif item == "unicode":
+                rendering.append(formula.unicode)
+            else:
+                rendering.append(formula.text_formula)
+        renderings.append(rendering[0] if isinstance(output, str) else tuple(rendering))
+    return renderings
 
 
 # Class for chemical formula strings
 class ChemFormulaString:
+    __slots__ = ("__formula", "__charge")
+
     def __init__(self, formula, charge=0):
-        self.formula = formula  # chemical formula
-        self.charge = charge    # charge of chemical formula
-        if self.charged:
-            self.text_formula = self.formula + " " + self.text_charge
-        else:
-            self.text_formula = self.formula
+        self.__formula = str(formula)                            # chemical formula
+        self.__charge = ChemFormulaString._check_charge(charge)  # charge of chemical formula
 
     # formula as standard string output
     def __str__(self):
@@ -25,24 +157,18 @@ class ChemFormulaString:
     def formula(self):
         return self.__formula
 
-    @formula.setter
-    def formula(self, input_formula):
-        self.__formula = str(input_formula)
-
     # Returns the charge of the formula object
     @property
     def charge(self):
         return self.__charge
 
     # Checks, whether the charge is valid
-    @charge.setter
-    def charge(self, charge):
+    def _check_charge(charge):
         if isinstance(charge, int):
-            self.__charge = charge
-        else:
-            raise TypeError(
-                f"Invalid Charge Value '{charge}' (expected an integer (<class 'int'>), but found {type(charge)})"
-            )
+            return charge
+        raise TypeError(
+            f"Invalid Charge Value '{charge}' (expected an integer (<class 'int'>), but found {type(charge)})"
+        )
 
     # Boolean property whether the formula object is charged (True) or not (False)
     @property
@@ -64,11 +190,9 @@ class ChemFormulaString:
     # Returns formula and charge as a text string
     @property
     def text_formula(self):
-        return self.__text_formula
-
-    @text_formula.setter
-    def text_formula(self, text_formula_charge):
-        self.__text_formula = text_formula_charge
+        if self.charged:
+            return self.formula + " " + self.text_charge
+        return self.formula
 
     # Formats formula (ChemFormulaString object) as a customized strings
     def format_formula(self,
@@ -81,266 +205,336 @@ class ChemFormulaString:
                        charge_prefix="", charge_suffix="",
                        charge_positive="+", charge_negative="-"
                        ):
-        formatted_formula = re.sub(r"([\{\[\(\)\]\}]){1}", bracket_prefix + r"\g<1>" + bracket_suffix, self.formula)
-        formatted_formula = re.sub(r"([A-Z]{1}[a-z]{0,1})", element_prefix + r"\g<1>" + element_suffix, formatted_formula)
-        formatted_formula = re.sub(r"(\d+)", freq_prefix + r"\g<1>" + freq_suffix, formatted_formula)
-        formatted_formula = re.sub(r"[\.\*]", multiply_symbol, formatted_formula)
-        # create charge string, by replacing + and - with the respective charge symbols
-        charge = self.text_charge
-        charge.replace("+", charge_positive)
-        charge.replace("-", charge_negative)
-        if self.charged:
-            return formula_prefix + formatted_formula + charge_prefix + charge + charge_suffix + formula_suffix
-        else:
-            return formula_prefix + formatted_formula + formula_suffix
+        renderer = _FormulaRenderer(formula_prefix,
+                                    element_prefix, element_suffix,
+                                    freq_prefix, freq_suffix,
+                                    formula_suffix,
+                                    bracket_prefix, bracket_suffix,
+                                    multiply_symbol,
+                                    charge_prefix, charge_suffix
+                                    )
+        start = perf_counter() if profiling.enabled else None
+        formatted_formula = renderer.render(_FORMAT_TOKENS.findall(self.formula), self.text_charge)
+        if start is not None:
+            profiling.record("format_formula", start)
+        return formatted_formula
 
     # Returns a LaTeX representation of a formula (ChemFormulaString object)
     @property
     def latex(self):
-        return self.format_formula("",
-                                   r"\\textnormal{", "}",
-                                   "_{", "}",
-                                   "",
-                                   r"\\",
-                                   multiply_symbol=r"\\cdot",
-                                   charge_prefix="^{", charge_suffix="}"
-                                   )
+        start = perf_counter() if profiling.enabled else None
+        latex_formula = _LATEX_RENDERER.render(_FORMAT_TOKENS.findall(self.formula), self.text_charge)
+        if start is not None:
+            profiling.record("latex", start)
+        return latex_formula
 
     # Returns an HTML representation of a formula (ChemFormulaString object)
     @property
     def html(self):
-        return self.format_formula("<span class='ChemFormula'>",
-                                   "", "",
-                                   "<sub>", "</sub>",
-                                   "</span>",
-                                   multiply_symbol="&sdot;",
-                                   charge_prefix="<sup>", charge_suffix="</sup>",
-                                   charge_negative="&ndash;"
-                                   )
+        start = perf_counter() if profiling.enabled else None
+        html_formula = _HTML_RENDERER.render(_FORMAT_TOKENS.findall(self.formula), self.text_charge)
+        if start is not None:
+            profiling.record("html", start)
+        return html_formula
 
     # Returns formula with unicode sub- and superscripts (₀₁₂₃₄₅₆₇₈₉⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻)
     @property
     def unicode(self):
-        subscript_num = "₀₁₂₃₄₅₆₇₈₉"
-        superscript_num = "⁰¹²³⁴⁵⁶⁷⁸⁹"
-        unicode_formula = self.formula     # start with original formula
-        unicode_charge = self.text_charge  # start with original text_charge
+        start = perf_counter() if profiling.enabled else None
         # replace all numbers (0 - 9) by subscript numbers (for elemental frequencies)
         # and superscript numbers (for charge information)
-        for number in range(0, 10):
-            unicode_formula = unicode_formula.replace(str(number), subscript_num[number])
-            unicode_charge = unicode_charge.replace(str(number), superscript_num[number])
-        unicode_charge = unicode_charge.replace("+", "⁺")
-        unicode_charge = unicode_charge.replace("-", "⁻")
-        return unicode_formula + unicode_charge
+        unicode_formula = self.formula.translate(_SUBSCRIPT_DIGITS) + self.text_charge.translate(_SUPERSCRIPT_CHARGE)
+        if start is not None:
+            profiling.record("unicode", start)
+        return unicode_formula
 
 
 # Class for chemical formula objects
 class ChemFormula(ChemFormulaString):
-    def __init__(self, formula, charge=0, name=None, cas=None):
+    __slots__ = ("__name", "__cas", "__cas_number", "__composition", "__key", "__hill_sort_key",
+                 "__hill_composition", "__sum_string", "__hill_string", "__formula_weight",
+                 "__monoisotopic_mass")
+
+    def __init__(self, formula, charge=0, name=None, cas=None, lazy=False):
         # Parent information
         ChemFormulaString.__init__(self, formula, charge)
         # Additional input information
-        self.name = None if name is None else name
-        self.cas = None if cas is None else cas
-        # parse chemical formula and test for consistency
-        self.__clean_formula = self.__clean_up_formula()
-        self.__check_formula(self.__clean_formula)
-        self.__resolved_formula = self.__resolve_brackets(self.__clean_formula)
+        self.name = name
+        # the CAS registry number is validated during initialization (in lazy mode on first access),
+        # the CAS object is created on first access
+        self.__cas_number = cas
+        if cas is not None and not lazy:
+            cas_string(cas)
+        self.__cas = None
+        # parse chemical formula and test for consistency, the composition is stored as an immutable tuple
+        # of (element index, element frequency) pairs, the element index refers to elements.element_symbols;
+        # in lazy mode, the formula is parsed on first access to the composition (or by calling validate())
+        self.__composition = None if lazy else parse_composition(self.formula)
+        # derived values are computed on first access
+        self.__clear_derived_values()
+
+    # Returns the composition of the formula object, lazily created formula objects are parsed on first access
+    def _composition(self):
+        composition = self.__composition
+        if composition is None:
+            composition = self.__composition = parse_composition(self.formula)
+        return composition
+
+    # Parses a lazily created formula object (raises a ValueError for an invalid formula), returns the formula object
+    def validate(self):
+        self._composition()
+        return self
+
+    # Resets all memoized derived values
+    def __clear_derived_values(self):
+        self.__key = None
+        self.__hill_sort_key = None
+        self.__hill_composition = None
+        self.__sum_string = None
+        self.__hill_string = None
+        self.__formula_weight = None
+        self.__monoisotopic_mass = None
+
+    # Creates a chemical formula object directly from a composition (a tuple of (element index, element frequency)
+    # pairs) without parsing, the formula string is the contracted sum formula; the CAS registry number is validated
+    # on first access
+    @classmethod
+    def _from_composition(cls, composition, charge, name=None, cas=None):
+        sum_string = ChemFormula._contract_string((_ELEMENT_SYMBOLS[index], freq) for index, freq in composition)
+        chemical_formula = cls.__new__(cls)
+        ChemFormulaString.__init__(chemical_formula, sum_string, charge)
+        chemical_formula.name = name
+        chemical_formula.__cas = None
+        chemical_formula.__cas_number = cas
+        chemical_formula.__composition = composition
+        chemical_formula.__clear_derived_values()
+        chemical_formula.__sum_string = sum_string
+        return chemical_formula
+
+    # Adds two chemical formula objects: element frequencies and charges are summed up,
+    # name and CAS registry number are not transferred to the new formula object
+    def __add__(self, other):
+        if not isinstance(other, ChemFormula):
+            return NotImplemented
+        dict_index_freq = dict(self._composition())
+        for index, freq in other._composition():
+            dict_index_freq[index] = dict_index_freq.get(index, 0) + freq
+        return ChemFormula._from_composition(intern_composition(dict_index_freq.items()),
+                                             self.charge + other.charge)
+
+    # Subtracts a chemical formula object from another one: element frequencies and charges are subtracted,
+    # elements with a remaining frequency of zero are removed from the new formula object
+    def __sub__(self, other):
+        if not isinstance(other, ChemFormula):
+            return NotImplemented
+        dict_index_freq = dict(self._composition())
+        for index, freq in other._composition():
+            remaining_freq = dict_index_freq.get(index, 0) - freq
+            if remaining_freq < 0:
+                raise ValueError(
+                    f"Invalid Formula Subtraction (negative frequency of element '{_ELEMENT_SYMBOLS[index]}')"
+                )
+            dict_index_freq[index] = remaining_freq
+        return ChemFormula._from_composition(
+            intern_composition((index, freq) for index, freq in dict_index_freq.items() if freq != 0),
+            self.charge - other.charge,
+        )
+
+    # Multiplies all element frequencies and the charge of a chemical formula object by a non-negative integer
+    def __mul__(self, factor):
+        if not isinstance(factor, int) or isinstance(factor, bool):
+            return NotImplemented
+        if factor < 0:
+            raise ValueError(
+                f"Invalid Multiplier '{factor}' (expected a non-negative integer)"
+            )
+        if factor == 0:
+            return ChemFormula._from_composition((), 0)
+        return ChemFormula._from_composition(
+            intern_composition((index, freq * factor) for index, freq in self._composition()),
+            self.charge * factor,
+        )
+
+    __rmul__ = __mul__
+
+    # Returns the key for comparing and hashing chemical formula objects: the composition (sorted by element index,
+    # without elements with zero frequency), the charge and the CAS registry number (if provided) as an integer,
+    # the CAS registry number is taken from the validated input, so that changes of the CAS object do not change
+    # the key
+    def _key(self):
+        if self.__key is None:
+            self.__key = (tuple(sorted((index, freq) for index, freq in self._composition() if freq != 0)),
+                          self.charge,
+                          None if self.__cas_number is None else cas_integer(self.__cas_number))
+        return self.__key
 
     # Test if two chemical formla objects are identical
     def __eq__(self, other):
         # two chemical formula objects are considered to be equal if they have
         # the same chemical composition (in Hill notation), the same charge,
         # and the same CAS registry number (if provided)
-        return (str(self.hill_formula) == str(other.hill_formula) and self.charge == other.charge and self.cas == other.cas)
+        if not isinstance(other, ChemFormula):
+            return NotImplemented
+        return self._key() == other._key()
+
+    # Chemical formula objects are immutable, equal objects have the same hash value
+    def __hash__(self):
+        return hash(self._key())
+
+    # Returns the sort key for the lexical sorting according to Hill's notation: the (element symbol, element frequency)
+    # pairs in Hill notation with lowercase element symbols (without elements with zero frequency), i. e. formulas
+    # are first sorted alphabetically by their element symbols, then numerically by the element frequencies, and
+    # a shorter formula (with less elements) is lesser/smaller than a longer formula (with more elements) starting
+    # with the same elements
+    @property
+    def hill_sort_key(self):
+        if self.__hill_sort_key is None:
+            self.__hill_sort_key = tuple((element.lower(), freq) for element, freq in self._hill_composition()
+                                         if freq != 0)
+        return self.__hill_sort_key
 
     # Compares two formulas with respect to their lexical sorting according to Hill's notation
     def __lt__(self, other):
-        elements_self = tuple(self._element_hill_sorted.items())
-        elements_other = tuple(other._element_hill_sorted.items())
-        # cycle through the elements in Hill notation
-        for i in range(0, min(len(elements_self), len(elements_other))):
-            # first check for the alphabetical sorting of the element symbol
-            if elements_self[i][0].lower() < elements_other[i][0].lower():
-                return True
-            if elements_self[i][0].lower() > elements_other[i][0].lower():
-                return False
-            # if the element symbol is identical, check the frequency of that element
-            if elements_self[i][0] == elements_other[i][0] and elements_self[i][1] < elements_other[i][1]:
-                return True
-            if elements_self[i][0] == elements_other[i][0] and elements_self[i][1] > elements_other[i][1]:
-                return False
-            # if everything to this point is identical then:
-            # the shorter formula (with less elements) is always lesser/smaller than the longer formula (with more elements)
-            if len(elements_self) - 1 == i and len(elements_other) - 1 > i:
-                return True
-        # if everything has failed so far then Self > Other
-        return False
-
-    # Clean up chemical formula, i. e. harmonize brackets, add quantifier "1" to bracketed units without quantifier
-    def __clean_up_formula(self):
-        formula = self.formula
-        # for simplicity reasons: create a (...)1 around the whole formula
-        formula = "(" + formula + ")1"
-        # replace all type of brackets ("{", "[") by round brackets "("
-        formula = re.sub(r"[\{\[\(]", "(", formula)
-        formula = re.sub(r"[\)\]\}]", ")", formula)
-        # replace all whitespaces, dots and asterisks
-        formula = re.sub(r"[\.\s\*]+", "", formula)
-        # search for brackets without a frequency information (...) and add a frequency of 1 => (...)1
-        formula = re.sub(r"\)(\D)", r")1\g<1>", formula)
-        return formula
-
-    # Checks whether the formula is valid regarding bracketing
-    def __check_formula(self, formula):
-        bracket_counter = 0
-        for character in formula:
-            if character == "(":
-                bracket_counter += 1
-            if character == ")":
-                bracket_counter -= 1
-            if bracket_counter < 0:  # there are more closing brackets than opening brackets during parsing formula
-                raise ValueError(
-                    "Invalid Bracket Structure in Formula (expecting an opening bracket, but found a closing bracket)"
-                )
-        if not bracket_counter == 0:  # number of opening brackets is not identical to the number of closing brackets
-            raise ValueError(
-                "Invalid Bracket Structure in Formula (inconsistent number of opening and closing brackets)"
-            )
-        if re.search("[a-z]{2,}", formula):  # at least two lowercase letters found in sequence
-            raise ValueError(
-                "Invalid Element Symbol (two lowercase letters found in sequence)"
-            )
-        for element in re.findall("[A-Z]{1}[a-z]{0,1}", formula):
-            if elements.atomic_weight(element) is False:
-                raise ValueError(
-                    f"Invalid Element Symbol (unknown element symbol '{element}')"
-                )
-        # no error found
-        return True
-
-    # Recursively resolve all brackets in the provided formula
-    def __resolve_brackets(self, formula):
-        # stop recursion if formula contains no more brackets
-        if "(" in formula:
-            # find smallest bracket unit, i. e. a bracketed entity that does not contain any other brackets
-            most_inner_bracket_unit = re.search(r"\(([A-Za-z0-9]*)\)(\d+)", formula)
-            # remove smallest bracket unit from original formula string using match.span() and string splicing
-            pre_match = formula[0:most_inner_bracket_unit.span()[0]:]  # string before the bracketed unit
-            post_match = formula[most_inner_bracket_unit.span()[1]::]  # string after the bracketed unit
-            inner_match = most_inner_bracket_unit.group(1)             # string of the bracketed unit
-            multiplier_match = int(most_inner_bracket_unit.group(2))   # multiplier of the bracketed unit
-            # find all element symbols + (optional) element frequency occurrences of inner_match
-            element_freq_list = re.findall(r"[A-Z]{1}[a-z]{0,1}\d*", inner_match)
-            # separate the element symbol portion from the number portion (if any) for all occurrences
-            resolved_match = ""
-            for element_freq_item in element_freq_list:
-                element_freq = re.match(r"(\D+)(\d*)", element_freq_item)
-                element = element_freq.group(1)
-                freq = element_freq.group(2)
-                if not freq:
-                    freq = 1  # if no number is given, use a frequency of 1
-                # create a resolved version of the bracketed unit and replace the bracketed unit with this resolved string
-                resolved_match += str(element) + str(int(freq) * multiplier_match)
-            formula = pre_match + resolved_match + post_match
-            # recursively resolve brackets
-            formula = self.__resolve_brackets(formula)
-        return str(formula)
+        if not isinstance(other, ChemFormula):
+            return NotImplemented
+        return self.hill_sort_key < other.hill_sort_key
+
+    def __le__(self, other):
+        if not isinstance(other, ChemFormula):
+            return NotImplemented
+        return self.hill_sort_key <= other.hill_sort_key
+
+    def __gt__(self, other):
+        if not isinstance(other, ChemFormula):
+            return NotImplemented
+        return self.hill_sort_key > other.hill_sort_key
+
+    def __ge__(self, other):
+        if not isinstance(other, ChemFormula):
+            return NotImplemented
+        return self.hill_sort_key >= other.hill_sort_key
 
     # Returns the formula as a dictionary with (key : value) = (element symbol : element frequency)
     @property
     def element(self):
-        # find all occurrences of one capital letter, possibly one lower case letter and some multiplier number
-        # Note: a multiplier number is always present in resolved formulas
-        dict_formula = defaultdict(lambda: 0)  # if element symbol does not exist, set start frequency to 0
-        element_freq_list = re.findall(r"[A-Z]{1}[a-z]{0,1}\d+", self.__resolved_formula)
-        # separate for each occurrence the letter portion from the number portion (if any)
-        for element_freq_item in element_freq_list:
-            # separate element symbol from element frequency
-            element_freq = re.match(r"(\D+)(\d+)", element_freq_item)
-            element = element_freq.group(1)
-            freq = element_freq.group(2)
-            # create a dictionary with element symbols as keys and element frequencies as values
-            dict_formula[element] += int(freq)
-        return dict(dict_formula)
+        start = perf_counter() if profiling.enabled else None
+        dict_formula = {_ELEMENT_SYMBOLS[index]: freq for index, freq in self._composition()}
+        if start is not None:
+            profiling.record("element", start)
+        return dict_formula
+
+    # Returns the (element symbol, element frequency) pairs of the formula in Hill sorting
+    def _hill_composition(self):
+        if self.__hill_composition is None:
+            start = perf_counter() if profiling.enabled else None
+            self.__hill_composition = hill_composition(self._composition())
+            if start is not None:
+                profiling.record("hill_formula", start)
+        return self.__hill_composition
 
     # Return the formula as a dictionalry with (key : value) = (element symbol : element frequency) in Hill sorting
     @property
     def _element_hill_sorted(self):
-        dict_sorted_elements = dict(sorted(self.element.items()))
-        dict_hill_sorted_elements = {}
-        # extract "C" and "H" (if "C" is also present) from the original dictionary
-        if "C" in dict_sorted_elements.keys():
-            dict_hill_sorted_elements["C"] = dict_sorted_elements["C"]
-            del dict_sorted_elements["C"]
-            if "H" in dict_sorted_elements.keys():
-                dict_hill_sorted_elements["H"] = dict_sorted_elements["H"]
-                del dict_sorted_elements["H"]
-        # create new Hill dictionary by placing "C" and "H" (if "C" is also present) in front of all other elements
-        dict_hill_sorted_elements = dict_hill_sorted_elements | dict_sorted_elements
-        return dict(dict_hill_sorted_elements)
+        return dict(self._hill_composition())
 
-    # function to contract formula from a given (element symbol : element frequency) dictionary
-    def _contract_formula(dict_element_freq, charge):
+    # function to contract formula from given (element symbol, element frequency) pairs
+    def _contract_string(element_freq_pairs):
         formula_output = ""
-        for element, freq in dict_element_freq.items():
+        for element, freq in element_freq_pairs:
             formula_output += element  # element symbol
             if freq > 1:
                 formula_output += str(freq)  # add multipliers when they are greater than 1
-        return ChemFormulaString(formula_output, charge)
+        return formula_output
+
+    # function to contract formula from a given (element symbol : element frequency) dictionary
+    def _contract_formula(dict_element_freq, charge):
+        return ChemFormulaString(ChemFormula._contract_string(dict_element_freq.items()), charge)
 
     # Generate sum formula as a string
     @property
     def sum_formula(self):
-        return ChemFormula._contract_formula(self.element, self.charge)
+        if self.__sum_string is None:
+            start = perf_counter() if profiling.enabled else None
+            self.__sum_string = ChemFormula._contract_string(
+                (_ELEMENT_SYMBOLS[index], freq) for index, freq in self._composition()
+            )
+            if start is not None:
+                profiling.record("sum_formula", start)
+        return ChemFormulaString(self.__sum_string, self.charge)
 
     # Generate sum formula as a string
     # Source: Edwin A. Hill, J. Am. Chem. Soc., 1900 (22), 8, 478-494 (https://doi.org/10.1021/ja02046a005)
     @property
     def hill_formula(self):
-        return ChemFormula._contract_formula(self._element_hill_sorted, self.charge)
+        if self.__hill_string is None:
+            self.__hill_string = ChemFormula._contract_string(self._hill_composition())
+        return ChemFormulaString(self.__hill_string, self.charge)
 
     # Returns the formula weight of the formula object, atomic weights are taken from elements.py
     @property
     def formula_weight(self):
-        float_formula_weight = 0.0
-        for element, freq in self.element.items():
-            float_formula_weight += freq * elements.atomic_weight(element)
-        return float(float_formula_weight)
+        if self.__formula_weight is None:
+            start = perf_counter() if profiling.enabled else None
+            float_formula_weight = 0.0
+            for index, freq in self._composition():
+                float_formula_weight += freq * _ELEMENT_RECORDS[index].atomic_weight
+            self.__formula_weight = float(float_formula_weight)
+            if start is not None:
+                profiling.record("formula_weight", start)
+        return self.__formula_weight
+
+    # Returns the monoisotopic mass of the formula object (mass of the most abundant isotope of every element),
+    # isotope data is taken from isotopes.py
+    @property
+    def monoisotopic_mass(self):
+        if self.__monoisotopic_mass is None:
+            self.__monoisotopic_mass = isotopes.monoisotopic_mass(self.element)
+        return self.__monoisotopic_mass
+
+    # Returns the isotope pattern of the formula object as a list of (mass-to-charge ratio, probability) pairs,
+    # isotopologues with the same nucleon number are aggregated unless fine is True, see isotopes.isotope_pattern()
+    def isotope_pattern(self, threshold=1e-6, fine=False):
+        return isotopes.isotope_pattern(self.element, self.charge, threshold, fine)
 
     # Calculate mass fractions for each element in the formula as a dictionary, atomic weights are taken from elements.py
     @property
     def mass_fraction(self):
+        float_formula_weight = self.formula_weight
+        start = perf_counter() if profiling.enabled else None
         dict_mass_fraction = {}
-        for element, freq in self.element.items():
-            dict_mass_fraction[element] = float((freq * elements.atomic_weight(element)) / self.formula_weight)
-        return dict(dict_mass_fraction)
+        for index, freq in self._composition():
+            element = _ELEMENT_RECORDS[index]
+            dict_mass_fraction[element.symbol] = float((freq * element.atomic_weight) / float_formula_weight)
+        if start is not None:
+            profiling.record("mass_fraction", start)
+        return dict_mass_fraction
 
     # Checks, whether an element is classified as radioactive, radioactivitiy data is taken from elements.py
     @property
     def radioactive(self):
-        for sElement in self.element.keys():
-            if elements.radioactive_element(sElement):
+        for index, _ in self._composition():
+            if _ELEMENT_RECORDS[index].radioactive:
                 return True  # element and therefore the formula is radioactive
         return False  # no radioactive elements found and therefore no radioactive formula
 
-    # Returns the name of the formula
+    # Returns the name of the formula (as the string "None" if no name is given)
     @property
     def name(self):
-        return self.__name
+        return "None" if self.__name is None else self.__name
 
     # Makes sure, that the name of the formula is a string
     @name.setter
     def name(self, name):
-        self.__name = str(name)
+        self.__name = None if name is None else str(name)
 
-    # Returns the CAS registry number of the formula object
+    # Returns the name of the formula (None if no name is given)
+    def _name(self):
+        return self.__name
+
+    # Returns the CAS registry number of the formula object as a CAS object from the casregnum package,
+    # every formula object has its own CAS object (validated CAS registry numbers are cached)
     @property
     def cas(self):
-        return None if self.__cas is None else self.__cas
-
-    # Checks, whether the CAS registry number is valid by using the CAS class from CASRegistryNumber.py
-    @cas.setter
-    def cas(self, cas_rn):
-        self.__cas = None if cas_rn is None else casregnum.CAS(cas_rn)
+        if self.__cas is None and self.__cas_number is not None:
+            self.__cas = get_cas(self.__cas_number)
+        return self.__cas
@@ -0,0 +1,102 @@
+import argparse
+import contextlib
+import functools
+import sys
+import time
+
+from . import bulk
+from .chemformula import ChemFormula
+
+# Properties, which can be selected for the output
+PROPERTIES = ("hill_formula", "sum_formula", "formula_weight", "unicode", "latex", "html", "radioactive")
+
+
+# Returns the selected properties of one formula as strings, or the error message of an invalid formula
+def _convert_one(properties, formula):
+    try:
+        chemical_formula = ChemFormula(formula)
+    except ValueError as error:
+        return formula, None, str(error)
+    values = []
+    for property_name in properties:
+        value = getattr(chemical_formula, property_name)
+        values.append(repr(value) if isinstance(value, float) else str(value))
+    return formula, values, None
+
+
+# Converts a chunk of formulas (executed in the worker processes)
+def _convert_chunk(properties, formulas):
+    return [_convert_one(properties, formula) for formula in formulas]
+
+
+def _positive_integer(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, but found '{value}'")
+    return number
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog="chemformula",
+        description="Converts chemical formulas (one formula per line) and writes the selected properties "
+                    "as tab-separated values.",
+    )
+    parser.add_argument("input", nargs="?", default="-",
+                        help="formula file (default: read from stdin)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="output file (default: write to stdout)")
+    parser.add_argument("-p", "--property", dest="properties", action="append", choices=PROPERTIES,
+                        help="property to write, can be given several times (default: hill_formula and formula_weight)")
+    parser.add_argument("-j", "--jobs", type=_positive_integer, default=1,
+                        help="number of worker processes (default: 1)")
+    parser.add_argument("--chunksize", type=_positive_integer, default=1000,
+                        help="number of formulas per chunk (default: 1000)")
+    parser.add_argument("--header", action="store_true",
+                        help="write a header line with the property names")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="do not report invalid formulas and throughput statistics")
+    return parser
+
+
+# Entry point of the chemformula command
+def main(argv=None):
+    parser = _parser()
+    arguments = parser.parse_args(argv)
+    properties = tuple(arguments.properties or ("hill_formula", "formula_weight"))
+    start = time.perf_counter()
+    number_of_formulas = 0
+    number_of_errors = 0
+    # files are closed on exit of the with statement, also if opening the output file fails
+    with contextlib.ExitStack() as files:
+        try:
+            input_file = sys.stdin if arguments.input == "-" else \
+                files.enter_context(open(arguments.input, encoding="utf-8"))
+            output_file = sys.stdout if arguments.output == "-" else \
+                files.enter_context(open(arguments.output, "w", encoding="utf-8"))
+        except OSError as error:
+            parser.error(f"can't open '{error.filename}': {error.strerror}")
+        if arguments.header:
+            output_file.write("\t".join(("formula",) + properties) + "\n")
+        results = bulk.map_chunks(functools.partial(_convert_chunk, properties),
+                                  bulk.chunks(bulk.read_formulas(input_file), arguments.chunksize),
+                                  arguments.jobs)
+        lines = []
+        for formula, values, error in results:
+            number_of_formulas += 1
+            if error is not None:
+                number_of_errors += 1
+                values = [""] * len(properties)
+                if not arguments.quiet:
+                    print(f"{formula}: {error}", file=sys.stderr)
+            lines.append("\t".join([formula] + values) + "\n")
+            if len(lines) >= arguments.chunksize:
+                output_file.writelines(lines)
+                lines.clear()
+        output_file.writelines(lines)
+    if not arguments.quiet:
+        seconds = time.perf_counter() - start
+        rate = number_of_formulas / seconds if seconds > 0 else 0.0
+        print(f"{number_of_formulas} formulas ({number_of_errors} invalid) in {seconds:.2f} s "
+              f"({rate:,.0f} formulas/s)", file=sys.stderr)
+    return 1 if number_of_errors else 0
@@ -0,0 +1,200 @@
+import math
+
+from . import elements
+from .chemformula import ChemFormula, hill_composition
+from .parser import intern_composition
+
+# Default elements (and frequency ranges) for mass decompositions
+DEFAULT_ELEMENTS = {"C": (0, None), "H": (0, None), "N": (0, None), "O": (0, None), "P": (0, None), "S": (0, None)}
+
+# Valences for the calculation of rings plus double bonds equivalents (RDBE)
+VALENCES = {
+    "H": 1, "F": 1, "Cl": 1, "Br": 1, "I": 1, "Li": 1, "Na": 1, "K": 1,
+    "O": 2, "S": 2, "Se": 2, "Mg": 2, "Ca": 2,
+    "B": 3, "N": 3, "P": 3, "As": 3, "Al": 3,
+    "C": 4, "Si": 4, "Ge": 4,
+}
+
+# Integer masses are the atomic weights in units of 1/_SCALE u, rounded up
+_SCALE = 10_000
+
+
+# Returns the rings plus double bonds equivalents (RDBE) of a composition (dictionary with element frequencies),
+# RDBE = 1 + sum(frequency * (valence - 2)) / 2
+def rdbe(dict_element_freq):
+    rdbe_value = 1.0
+    for element, freq in dict_element_freq.items():
+        if element not in VALENCES:
+            raise ValueError(
+                f"Invalid Element for RDBE Calculation (no valence known for element '{element}')"
+            )
+        rdbe_value += freq * (VALENCES[element] - 2) / 2
+    return rdbe_value
+
+
+# Checks the element frequency ranges and returns (element symbol, atomic weight, minimum, maximum) tuples
+def _check_element_ranges(element_ranges):
+    checked_ranges = []
+    for element, (minimum, maximum) in element_ranges.items():
+        weight = elements.atomic_weight(element)
+        if weight is False:
+            raise ValueError(
+                f"Invalid Element Symbol (unknown element symbol '{element}')"
+            )
+        valid_minimum = isinstance(minimum, int) and minimum >= 0
+        valid_maximum = maximum is None or (isinstance(maximum, int) and valid_minimum and maximum >= minimum)
+        if not (valid_minimum and valid_maximum):
+            raise ValueError(
+                f"Invalid Element Range '{(minimum, maximum)}' for element '{element}' "
+                "(expected non-negative integers with minimum <= maximum, None for no maximum)"
+            )
+        checked_ranges.append((element, float(weight), minimum, maximum))
+    return checked_ranges
+
+
+# Returns the bitset of all integer masses below size, which can be formed from the integer masses of reachable
+# with 0 to maximum (None: any number of) additional atoms of integer mass weight
+def _add_element(reachable, weight, maximum, size):
+    mask = (1 << size) - 1
+    if maximum is None:
+        # after n doubling steps, all frequencies from 0 to 2^n - 1 are covered
+        step = weight
+        while step < size:
+            reachable = (reachable | (reachable << step)) & mask
+            step <<= 1
+    else:
+        # bounded frequencies from 0 to maximum by binary splitting (1, 2, 4, ..., remainder)
+        part = 1
+        while maximum > 0:
+            part = min(part, maximum)
+            reachable = (reachable | (reachable << (part * weight))) & mask
+            maximum -= part
+            part <<= 1
+    return reachable
+
+
+# Checks, whether any bit between lo and hi (both inclusive) is set in the little-endian bitset data
+def _any_bit(data, lo, hi):
+    lo = max(lo, 0)
+    hi = min(hi, len(data) * 8 - 1)
+    if lo > hi:
+        return False
+    chunk = int.from_bytes(data[lo >> 3:(hi >> 3) + 1], "little") >> (lo & 7)
+    return chunk & ((1 << (hi - lo + 1)) - 1) != 0
+
+
+# Enumerates all chemical formulas, whose mass-to-charge ratio is within mass ± ppm (parts per million),
+# element_ranges maps the allowed element symbols to (minimum, maximum) frequencies (None for no maximum),
+# rdbe_range optionally restricts the rings plus double bonds equivalents to (minimum, maximum);
+# returns chemical formula objects in Hill notation, ordered by their deviation from mass
+#
+# The elements are assigned from the heaviest to the lightest element in a depth-first search, the frequency of
+# the lightest element is calculated directly. Every branch is pruned by a precomputed table of all integer masses
+# that can be formed by the remaining lighter elements (dynamic programming over bitsets), integer masses are the
+# atomic weights rounded up on a fine grid, so their relative deviation from the real masses is bounded and the
+# pruning never discards a valid formula; all candidates are finally checked with the real atomic weights.
+def decompose_mass(mass, ppm=5, element_ranges=None, charge=0, rdbe_range=None):
+    if not isinstance(mass, (int, float)) or isinstance(mass, bool) or mass <= 0:
+        raise ValueError(
+            f"Invalid Mass '{mass}' (expected a positive number)"
+        )
+    if not isinstance(ppm, (int, float)) or isinstance(ppm, bool) or ppm < 0:
+        raise ValueError(
+            f"Invalid Tolerance '{ppm}' (expected a non-negative number)"
+        )
+    charge = ChemFormula._check_charge(charge)
+    element_ranges = _check_element_ranges(DEFAULT_ELEMENTS if element_ranges is None else element_ranges)
+    if not element_ranges:
+        return []
+    if rdbe_range is not None:
+        rdbe({element: 0 for element, _, _, _ in element_ranges})  # fails early for elements without valence
+
+    # the mass of charged formulas is mass-to-charge ratio times the absolute charge (electron masses are neglected)
+    target_mass = float(mass) * (abs(charge) or 1)
+    tolerance = target_mass * ppm * 1e-6
+    # the minimum frequencies are subtracted in advance, the search covers the additional atoms only
+    minimum_mass = sum(weight * minimum for _, weight, minimum, _ in element_ranges)
+    upper_mass = target_mass + tolerance - minimum_mass
+    if upper_mass < 0:
+        return []
+
+    element_ranges.sort(key=lambda element_range: element_range[1], reverse=True)
+    symbols = [symbol for symbol, _, _, _ in element_ranges]
+    weights = [weight for _, weight, _, _ in element_ranges]
+    minimums = [minimum for _, _, minimum, _ in element_ranges]
+    maximums = [None if maximum is None else maximum - minimum for _, _, minimum, maximum in element_ranges]
+    integer_weights = [math.ceil(weight * _SCALE) for weight in weights]
+    last = len(element_ranges) - 1
+
+    # reachable[level] is the bitset of integer masses, which can be formed by the elements from level to last,
+    # deviation[level] is the maximum relative deviation of these integer masses from the real masses
+    size = math.ceil(upper_mass * _SCALE * (1 + max(integer_weight / (weight * _SCALE) - 1
+                                                     for weight, integer_weight in zip(weights, integer_weights)))) + 2
+    reachable = [None] * (last + 1)
+    deviation = [0.0] * (last + 1)
+    bitset = 1
+    for level in range(last, 0, -1):
+        bitset = _add_element(bitset, integer_weights[level], maximums[level], size)
+        reachable[level] = bitset.to_bytes((size + 7) // 8, "little")
+        deviation[level] = max(deviation[level + 1] if level < last else 0.0,
+                               integer_weights[level] / (weights[level] * _SCALE) - 1)
+
+    lower_mass = target_mass - tolerance - minimum_mass
+    candidates = []
+    counts = [0] * (last + 1)
+
+    def search(level, lo, hi):
+        weight = weights[level]
+        maximum = maximums[level]
+        if level == last:
+            first = max(0, math.ceil(lo / weight) - 1)
+            final = math.floor(hi / weight) + 1
+            if maximum is not None:
+                final = min(final, maximum)
+            for freq in range(first, final + 1):
+                counts[level] = freq
+                candidates.append(tuple(counts))
+            return
+        final = math.floor(hi / weight)
+        if maximum is not None:
+            final = min(final, maximum)
+        for freq in range(final + 1):
+            remaining_lo = lo - freq * weight
+            remaining_hi = hi - freq * weight
+            # can the remaining mass be formed by the lighter elements?
+            if not _any_bit(reachable[level + 1],
+                            math.floor(remaining_lo * _SCALE) - 1,
+                            math.ceil(remaining_hi * _SCALE * (1 + deviation[level + 1])) + 1):
+                continue
+            counts[level] = freq
+            search(level + 1, remaining_lo, remaining_hi)
+        counts[level] = 0
+
+    search(0, lower_mass, upper_mass)
+
+    results = []
+    for candidate in candidates:
+        dict_element_freq = {symbol: minimum + freq
+                             for symbol, minimum, freq in zip(symbols, minimums, candidate)
+                             if minimum + freq > 0}
+        if not dict_element_freq:
+            continue
+        candidate_mass = sum(weight * (minimum + freq) for weight, minimum, freq in zip(weights, minimums, candidate))
+        deviation_mass = candidate_mass - target_mass
+        if abs(deviation_mass) > tolerance:
+            continue
+        if rdbe_range is not None:
+            rdbe_value = rdbe(dict_element_freq)
+            if (rdbe_range[0] is not None and rdbe_value < rdbe_range[0]) or \
+               (rdbe_range[1] is not None and rdbe_value > rdbe_range[1]):
+                continue
+        results.append((abs(deviation_mass), dict_element_freq))
+
+    chemical_formulas = []
+    for _, dict_element_freq in sorted(results, key=lambda result: result[0]):
+        # compose the formula in Hill notation
+        hill_pairs = hill_composition((elements.element_index[symbol], freq)
+                                      for symbol, freq in dict_element_freq.items())
+        composition = intern_composition((elements.element_index[symbol], freq) for symbol, freq in hill_pairs)
+        chemical_formulas.append(ChemFormula._from_composition(composition, charge))
+    return chemical_formulas
@@ -0,0 +1,125 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+from . import elements
+from .chemformula import ChemFormula
+
+# Positions of the set bits for every byte value, used to decode bitsets into positions
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+
+
+# Returns a bitset (an integer with bit i set for position i) of the given positions
+def _bitset(positions, size):
+    data = bytearray((size + 7) // 8)
+    for position in positions:
+        data[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(data, "little")
+
+
+# Returns the positions of all set bits of a bitset in ascending order
+def _positions(bitset):
+    data = bitset.to_bytes((bitset.bit_length() + 7) // 8, "little")
+    positions = []
+    for byte_position, byte in enumerate(data):
+        if byte:
+            offset = byte_position << 3
+            positions.extend(offset + bit for bit in _BYTE_BITS[byte])
+    return positions
+
+
+# Checks, whether an element symbol is valid
+def _check_element(element):
+    if element not in elements.element_table:
+        raise ValueError(
+            f"Invalid Element Symbol (unknown element symbol '{element}')"
+        )
+    return element
+
+
+# Class for composition queries over large collections of chemical formulas: for every element, the formulas
+# containing it are stored as a bitset, and their element frequencies as a sorted array for range queries, so
+# that queries are answered by bitset intersections instead of inspecting every formula
+class FormulaElementIndex:
+    def __init__(self, formulas):
+        self.__formulas = tuple(formula if isinstance(formula, ChemFormula) else ChemFormula(formula)
+                                for formula in formulas)
+        size = len(self.__formulas)
+        postings = {}
+        for position, chemical_formula in enumerate(self.__formulas):
+            for element, freq in chemical_formula.element.items():
+                if freq > 0:  # elements with a frequency of zero are not present in the formula
+                    postings.setdefault(element, []).append((freq, position))
+        # element symbol : bitset of all formulas containing the element
+        self.__presence = {}
+        # element symbol : (frequencies in ascending order, positions of the corresponding formulas)
+        self.__frequencies = {}
+        for element, freq_positions in postings.items():
+            self.__presence[element] = _bitset((position for _, position in freq_positions), size)
+            freq_positions.sort()
+            self.__frequencies[element] = (array("q", (freq for freq, _ in freq_positions)),
+                                           array("q", (position for _, position in freq_positions)))
+        self.__all = (1 << size) - 1
+
+    # Returns the number of indexed formulas
+    def __len__(self):
+        return len(self.__formulas)
+
+    # Returns the indexed chemical formula objects
+    @property
+    def formulas(self):
+        return self.__formulas
+
+    # Returns the bitset of all formulas containing the element with a frequency between minimum and maximum
+    # (both inclusive, None for an open bound)
+    def _frequency_range(self, element, minimum, maximum):
+        if minimum is not None and maximum is not None and minimum > maximum:
+            return 0
+        if minimum is None or minimum <= 0:
+            without_element = self.__all & ~self.__presence.get(element, 0)
+            if maximum is None:
+                return self.__all
+            if maximum <= 0:
+                return without_element
+            minimum = 1
+        else:
+            without_element = 0
+        if element not in self.__frequencies:
+            return without_element
+        frequencies, positions = self.__frequencies[element]
+        first = bisect_left(frequencies, minimum)
+        last = len(frequencies) if maximum is None else bisect_right(frequencies, maximum, first)
+        if first == 0 and last == len(frequencies):
+            return without_element | self.__presence[element]
+        return without_element | _bitset(positions[first:last], len(self.__formulas))
+
+    # Returns the bitset of all formulas matching the query: all elements of contains must be present,
+    # no element of excludes may be present, and counts maps element symbols to (minimum, maximum) frequency
+    # ranges (both inclusive, None for an open bound), bit i is set if the i-th formula matches
+    def mask(self, contains=(), excludes=(), counts=None):
+        if isinstance(contains, str):
+            contains = (contains,)
+        if isinstance(excludes, str):
+            excludes = (excludes,)
+        bitset = self.__all
+        for element in contains:
+            bitset &= self.__presence.get(_check_element(element), 0)
+        for element in excludes:
+            bitset &= ~self.__presence.get(_check_element(element), 0)
+        for element, (minimum, maximum) in (counts or {}).items():
+            if not bitset:
+                break
+            bitset &= self._frequency_range(_check_element(element), minimum, maximum)
+        return bitset
+
+    # Returns the positions of all matching formulas (see mask())
+    def positions(self, contains=(), excludes=(), counts=None):
+        return _positions(self.mask(contains, excludes, counts))
+
+    # Returns all matching chemical formula objects (see mask()) in the order of the index
+    def query(self, contains=(), excludes=(), counts=None):
+        formulas = self.__formulas
+        return [formulas[position] for position in self.positions(contains, excludes, counts)]
+
+    # Returns the number of matching formulas (see mask())
+    def count(self, contains=(), excludes=(), counts=None):
+        return bin(self.mask(contains, excludes, counts)).count("1")
@@ -19,138 +19,174 @@ Quoted atomic weights are those suggested for materials where the origin of the
 For radioactive elements the isotope with the longest half-life is quoted as an integer.
 '''
 
+import zlib
+from collections import namedtuple
+from types import MappingProxyType
+
+atomic_weight_table = MappingProxyType({
+    "H":    1.008,
+    "He":   4.002602,
+    "Li":   6.94,
+    "Be":   9.0121831,
+    "B":   10.81,
+    "C":   12.011,
+    "N":   14.007,
+    "O":   15.999,
+    "F":   18.998403162,
+    "Ne":  20.1797,
+    "Na":  22.98976928,
+    "Mg":  24.305,
+    "Al":  26.9815384,
+    "Si":  28.085,
+    "P":   30.973761998,
+    "S":   32.06,
+    "Cl":  35.45,
+    "Ar":  39.95,
+    "K":   39.0983,
+    "Ca":  40.078,
+    "Sc":  44.955907,
+    "Ti":  47.867,
+    "V":   50.9415,
+    "Cr":  51.9961,
+    "Mn":  54.938043,
+    "Fe":  55.845,
+    "Co":  58.933194,
+    "Ni":  58.6934,
+    "Cu":  63.546,
+    "Zn":  65.38,
+    "Ga":  69.723,
+    "Ge":  72.630,
+    "As":  74.921595,
+    "Se":  78.971,
+    "Br":  79.904,
+    "Kr":  83.798,
+    "Rb":  85.4678,
+    "Sr":  87.62,
+    "Y":   88.905838,
+    "Zr":  91.222,
+    "Nb":  92.90637,
+    "Mo":  95.95,
+    "Tc":  97,
+    "Ru": 101.07,
+    "Rh": 102.90549,
+    "Pd": 106.42,
+    "Ag": 107.8682,
+    "Cd": 112.414,
+    "In": 114.818,
+    "Sn": 118.710,
+    "Sb": 121.760,
+    "Te": 127.60,
+    "I":  126.90447,
+    "Xe": 131.293,
+    "Cs": 132.90545196,
+    "Ba": 137.327,
+    "La": 138.90547,
+    "Ce": 140.116,
+    "Pr": 140.90766,
+    "Nd": 144.242,
+    "Pm": 145,
+    "Sm": 150.36,
+    "Eu": 151.964,
+    "Gd": 157.249,
+    "Tb": 158.925354,
+    "Dy": 162.500,
+    "Ho": 164.930329,
+    "Er": 167.259,
+    "Tm": 168.934219,
+    "Yb": 173.045,
+    "Lu": 174.96669,
+    "Hf": 178.486,
+    "Ta": 180.94788,
+    "W":  183.84,
+    "Re": 186.207,
+    "Os": 190.23,
+    "Ir": 192.217,
+    "Pt": 195.084,
+    "Au": 196.966570,
+    "Hg": 200.592,
+    "Tl": 204.38,
+    "Pb": 207.2,
+    "Bi": 208.98040,
+    "Po": 209,
+    "At": 210,
+    "Rn": 222,
+    "Fr": 223,
+    "Ra": 226,
+    "Ac": 227,
+    "Th": 232.0377,
+    "Pa": 231.03588,
+    "U":  238.02891,
+    "Np": 237,
+    "Pu": 244,
+    "Am": 243,
+    "Cm": 247,
+    "Bk": 247,
+    "Cf": 251,
+    "Es": 252,
+    "Fm": 257,
+    "Md": 258,
+    "No": 259,
+    "Lr": 262,
+    "Rf": 267,
+    "Db": 270,
+    "Sg": 269,
+    "Bh": 270,
+    "Hs": 270,
+    "Mt": 278,
+    "Ds": 281,
+    "Rg": 281,
+    "Cn": 285,
+    "Nh": 286,
+    "Fl": 289,
+    "Mc": 289,
+    "Lv": 293,
+    "Ts": 293,
+    "Og": 294
+})
+
+
+radioactive_elements = frozenset({
+    "Tc",
+    "Po", "At", "Rn",
+    "Fr", "Ra", "Pm", "Ac", "Rf", "Db", "Sg", "Bh", "Hs", "Mt", "Ds", "Rg", "Cn", "Nh", "Fl", "Mc", "Lv", "Ts", "Og",
+    "Th", "Pa", "U", "Np", "Pu", "Am", "Cm", "Bk", "Cf", "Es", "Fm", "Md", "No", "Lr"
+})
+
+# Record of an element with its element symbol, atomic number, atomic weight and radioactivity
+Element = namedtuple("Element", ["symbol", "atomic_number", "atomic_weight", "radioactive"])
+
+# Immutable element table with (key : value) = (element symbol : Element record), built once at import,
+# the atomic number of an element is given by its position in the atomic weight table
+element_table = MappingProxyType({
+    symbol: Element(symbol, atomic_number, float(weight), symbol in radioactive_elements)
+    for atomic_number, (symbol, weight) in enumerate(atomic_weight_table.items(), start=1)
+})
+
+# Element symbols in order of their atomic numbers
+element_symbols = tuple(element_table)
+
+# (key : value) = (element symbol : element index), the element index refers to element_symbols
+element_index = MappingProxyType({symbol: index for index, symbol in enumerate(element_symbols)})
+
+
+def lookup(element):
+    # return the Element record of the element symbol passed to the function, None if element symbol does not exist
+    return element_table.get(element)
+
 
 def atomic_weight(element):
-    atomic_weight_table = {
-        "H":    1.008,
-        "He":   4.002602,
-        "Li":   6.94,
-        "Be":   9.0121831,
-        "B":   10.81,
-        "C":   12.011,
-        "N":   14.007,
-        "O":   15.999,
-        "F":   18.998403162,
-        "Ne":  20.1797,
-        "Na":  22.98976928,
-        "Mg":  24.305,
-        "Al":  26.9815384,
-        "Si":  28.085,
-        "P":   30.973761998,
-        "S":   32.06,
-        "Cl":  35.45,
-        "Ar":  39.95,
-        "K":   39.0983,
-        "Ca":  40.078,
-        "Sc":  44.955907,
-        "Ti":  47.867,
-        "V":   50.9415,
-        "Cr":  51.9961,
-        "Mn":  54.938043,
-        "Fe":  55.845,
-        "Co":  58.933194,
-        "Ni":  58.6934,
-        "Cu":  63.546,
-        "Zn":  65.38,
-        "Ga":  69.723,
-        "Ge":  72.630,
-        "As":  74.921595,
-        "Se":  78.971,
-        "Br":  79.904,
-        "Kr":  83.798,
-        "Rb":  85.4678,
-        "Sr":  87.62,
-        "Y":   88.905838,
-        "Zr":  91.222,
-        "Nb":  92.90637,
-        "Mo":  95.95,
-        "Tc":  97,
-        "Ru": 101.07,
-        "Rh": 102.90549,
-        "Pd": 106.42,
-        "Ag": 107.8682,
-        "Cd": 112.414,
-        "In": 114.818,
-        "Sn": 118.710,
-        "Sb": 121.760,
-        "Te": 127.60,
-        "I":  126.90447,
-        "Xe": 131.293,
-        "Cs": 132.90545196,
-        "Ba": 137.327,
-        "La": 138.90547,
-        "Ce": 140.116,
-        "Pr": 140.90766,
-        "Nd": 144.242,
-        "Pm": 145,
-        "Sm": 150.36,
-        "Eu": 151.964,
-        "Gd": 157.249,
-        "Tb": 158.925354,
-        "Dy": 162.500,
-        "Ho": 164.930329,
-        "Er": 167.259,
-        "Tm": 168.934219,
-        "Yb": 173.045,
-        "Lu": 174.96669,
-        "Hf": 178.486,
-        "Ta": 180.94788,
-        "W":  183.84,
-        "Re": 186.207,
-        "Os": 190.23,
-        "Ir": 192.217,
-        "Pt": 195.084,
-        "Au": 196.966570,
-        "Hg": 200.592,
-        "Tl": 204.38,
-        "Pb": 207.2,
-        "Bi": 208.98040,
-        "Po": 209,
-        "At": 210,
-        "Rn": 222,
-        "Fr": 223,
-        "Ra": 226,
-        "Ac": 227,
-        "Th": 232.0377,
-        "Pa": 231.03588,
-        "U":  238.02891,
-        "Np": 237,
-        "Pu": 244,
-        "Am": 243,
-        "Cm": 247,
-        "Bk": 247,
-        "Cf": 251,
-        "Es": 252,
-        "Fm": 257,
-        "Md": 258,
-        "No": 259,
-        "Lr": 262,
-        "Rf": 267,
-        "Db": 270,
-        "Sg": 269,
-        "Bh": 270,
-        "Hs": 270,
-        "Mt": 278,
-        "Ds": 281,
-        "Rg": 281,
-        "Cn": 285,
-        "Nh": 286,
-        "Fl": 289,
-        "Mc": 289,
-        "Lv": 293,
-        "Ts": 293,
-        "Og": 294
-    }
     # return atomic weight of the element symbol passed to the function, False if element symbol does not exist
-    return float(atomic_weight_table[element]) if element in atomic_weight_table else False
+    record = element_table.get(element)
+    return False if record is None else record.atomic_weight
 
 
 def radioactive_element(element):
-    radioactive_elements = [
-        "Tc",
-        "Po", "At", "Rn",
-        "Fr", "Ra", "Pm", "Ac", "Rf", "Db", "Sg", "Bh", "Hs", "Mt", "Ds", "Rg", "Cn", "Nh", "Fl", "Mc", "Lv", "Ts", "Og",
-        "Th", "Pa", "U", "Np", "Pu", "Am", "Cm", "Bk", "Cf", "Es", "Fm", "Md", "No", "Lr"
-    ]
-    # element is in the list of radioactive elements => True else False
+    # element is in the set of radioactive elements => True else False
     return element in radioactive_elements
+
+
+def element_table_checksum():
+    # return a checksum of the element table (element symbols and atomic weights), values derived from the element
+    # table (e. g. stored formula weights or element indices) are only valid for the same checksum
+    return zlib.crc32("|".join(f"{record.symbol}:{record.atomic_weight!r}"
+                               for record in element_table.values()).encode("utf-8"))
@@ -0,0 +1,47 @@
+from .chemformula import ChemFormula, ChemFormulaString, hill_composition
+from .elements import element_symbols, element_table
+from .parser import parse_composition
+
+# Atomic weights, indexed by the element index of a composition
+_ATOMIC_WEIGHTS = tuple(record.atomic_weight for record in element_table.values())
+
+
+# Returns the composition of a formula string as a dictionary with (key : value) = (element symbol : element frequency)
+# (same as ChemFormula(formula).element, but without creating a chemical formula object)
+def composition(formula):
+    return {element_symbols[index]: freq for index, freq in parse_composition(str(formula))}
+
+
+# Returns the sum formula of a formula string in Hill notation as a string, charged formulas are returned with their
+# charge (e. g. "O4S 2-") (same as ChemFormula(formula, charge).hill_formula.text_formula, but without creating
+# a chemical formula object)
+def hill(formula, charge=0):
+    hill_formula = ChemFormula._contract_string(hill_composition(parse_composition(str(formula))))
+    if ChemFormulaString._check_charge(charge) == 0:
+        return hill_formula
+    return ChemFormulaString(hill_formula, charge).text_formula
+
+
+# Returns the formula weight of a formula string (same as ChemFormula(formula).formula_weight, but without creating
+# a chemical formula object)
+def weight(formula):
+    float_formula_weight = 0.0
+    for index, freq in parse_composition(str(formula)):
+        float_formula_weight += freq * _ATOMIC_WEIGHTS[index]
+    return float_formula_weight
+
+
+# Returns the compositions of many formula strings as a list of dictionaries
+def composition_many(formulas):
+    return [composition(formula) for formula in formulas]
+
+
+# Returns the sum formulas of many formula strings in Hill notation as a list of strings,
+# all formulas have the same charge
+def hill_many(formulas, charge=0):
+    return [hill(formula, charge) for formula in formulas]
+
+
+# Returns the formula weights of many formula strings as a list of floats
+def weight_many(formulas):
+    return [weight(formula) for formula in formulas]
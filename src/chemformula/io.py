@@ -0,0 +1,109 @@
+import contextlib
+import csv
+import json
+import os
+
+from .chemformula import ChemFormula
+
+# Fields added to every record by enrich()
+ENRICHED_FIELDS = ("hill_formula", "formula_weight", "mass_fraction", "html", "latex", "error")
+
+
+# Opens a file path, file objects (e. g. sys.stdin) are passed through without being closed afterwards
+def _open(source, mode):
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, mode, encoding="utf-8", newline="")
+    return contextlib.nullcontext(source)
+
+
+# Converts the charge of a record into an integer (empty values are interpreted as no charge), charges must be
+# integers or strings of integers, booleans and floats are rejected
+def _charge(charge):
+    if charge is None or charge == "":
+        return 0
+    if isinstance(charge, str):
+        try:
+            return int(charge)
+        except ValueError:
+            raise ValueError(
+                f"Invalid Charge Value '{charge}' (expected an integer)"
+            ) from None
+    if isinstance(charge, bool) or not isinstance(charge, int):
+        raise TypeError(
+            f"Invalid Charge Value '{charge}' (expected an integer (<class 'int'>), but found {type(charge)})"
+        )
+    return charge
+
+
+# Returns the formula of a record, records without formula are invalid
+def _formula(record):
+    formula = record.get("formula")
+    if formula is None:
+        raise ValueError(
+            "Invalid Record (no formula field)"
+        )
+    return formula
+
+
+# Reads records line by line from a CSV file with a header line (at least a "formula" column,
+# optional "charge", "name" and "cas" columns), yields one dictionary per line
+def read_csv(source, **csv_options):
+    with _open(source, "r") as csv_file:
+        yield from csv.DictReader(csv_file, **csv_options)
+
+
+# Reads records line by line from a JSON Lines file (one JSON object per line), yields one dictionary per line
+def read_jsonl(source):
+    with _open(source, "r") as jsonl_file:
+        for line in jsonl_file:
+            if line.strip():
+                yield json.loads(line)
+
+
+# Parses the formula of every record and yields the record with the fields of ENRICHED_FIELDS added,
+# records without formula or with invalid formulas, charges or CAS registry numbers are yielded with an error message
+def enrich(records):
+    for record in records:
+        record = dict(record)
+        try:
+            chemical_formula = ChemFormula(_formula(record),
+                                           _charge(record.get("charge")),
+                                           record.get("name") or None,
+                                           record.get("cas") or None)
+        except (TypeError, ValueError) as error:
+            record.update(dict.fromkeys(ENRICHED_FIELDS))
+            record["error"] = str(error)
+        else:
+            record["hill_formula"] = str(chemical_formula.hill_formula)
+            record["formula_weight"] = chemical_formula.formula_weight
+            record["mass_fraction"] = chemical_formula.mass_fraction
+            record["html"] = chemical_formula.html
+            record["latex"] = chemical_formula.latex
+            record["error"] = None
+        yield record
+
+
+# Writes records to a CSV file, the columns are taken from fieldnames or from the first record,
+# dictionaries (e. g. mass fractions) are written as JSON strings, returns the number of written records
+def write_csv(records, target, fieldnames=None, **csv_options):
+    count = 0
+    with _open(target, "w") as csv_file:
+        writer = None
+        for record in records:
+            if writer is None:
+                writer = csv.DictWriter(csv_file, fieldnames or list(record), extrasaction="ignore", **csv_options)
+                writer.writeheader()
+            writer.writerow({key: json.dumps(value) if isinstance(value, dict) else value
+                             for key, value in record.items()})
+            count += 1
+    return count
+
+
+# Writes records to a JSON Lines file (one JSON object per line), returns the number of written records
+def write_jsonl(records, target):
+    count = 0
+    with _open(target, "w") as jsonl_file:
+        for record in records:
+            jsonl_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    return count
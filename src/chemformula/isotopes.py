@@ -0,0 +1,241 @@
+'''
+ISOTOPIC COMPOSITIONS OF THE ELEMENTS
+relative atomic masses and representative isotopic abundances of the stable (and very long-lived) isotopes
+
+Data taken from: https://www.nist.gov/pml/atomic-weights-and-isotopic-compositions-relative-atomic-masses
+(Atomic Weights and Isotopic Compositions, NIST Standard Reference Database 144)
+
+Isotope data is provided for all elements with a natural isotopic composition, i. e. for hydrogen to uranium
+except technetium, promethium and polonium to actinium.
+'''
+
+import functools
+from types import MappingProxyType
+
+# (key : value) = (element symbol : ((mass number, relative atomic mass, abundance), ...))
+isotope_table = MappingProxyType({
+    "H":  ((1, 1.00782503207, 0.999885), (2, 2.0141017778, 0.000115)),
+    "He": ((3, 3.0160293191, 0.00000134), (4, 4.00260325415, 0.99999866)),
+    "Li": ((6, 6.015122795, 0.0759), (7, 7.01600455, 0.9241)),
+    "Be": ((9, 9.0121822, 1.0),),
+    "B":  ((10, 10.0129370, 0.199), (11, 11.0093054, 0.801)),
+    "C":  ((12, 12.0, 0.9893), (13, 13.0033548378, 0.0107)),
+    "N":  ((14, 14.0030740048, 0.99636), (15, 15.0001088982, 0.00364)),
+    "O":  ((16, 15.99491461956, 0.99757), (17, 16.99913170, 0.00038), (18, 17.9991610, 0.00205)),
+    "F":  ((19, 18.99840322, 1.0),),
+    "Ne": ((20, 19.9924401754, 0.9048), (21, 20.99384668, 0.0027), (22, 21.991385114, 0.0925)),
+    "Na": ((23, 22.9897692809, 1.0),),
+    "Mg": ((24, 23.985041700, 0.7899), (25, 24.98583692, 0.1000), (26, 25.982592929, 0.1101)),
+    "Al": ((27, 26.98153863, 1.0),),
+    "Si": ((28, 27.9769265325, 0.92223), (29, 28.976494700, 0.04685), (30, 29.97377017, 0.03092)),
+    "P":  ((31, 30.97376163, 1.0),),
+    "S":  ((32, 31.97207100, 0.9499), (33, 32.97145876, 0.0075), (34, 33.96786690, 0.0425),
+           (36, 35.96708076, 0.0001)),
+    "Cl": ((35, 34.96885268, 0.7576), (37, 36.96590259, 0.2424)),
+    "Ar": ((36, 35.967545106, 0.003365), (38, 37.9627324, 0.000632), (40, 39.9623831225, 0.996003)),
+    "K":  ((39, 38.96370668, 0.932581), (40, 39.96399848, 0.000117), (41, 40.96182576, 0.067302)),
+    "Ca": ((40, 39.96259098, 0.96941), (42, 41.95861801, 0.00647), (43, 42.9587666, 0.00135),
+           (44, 43.9554818, 0.02086), (46, 45.9536926, 0.00004), (48, 47.952534, 0.00187)),
+    "Sc":((45, 44.9559119, 1.0),),
+    "Ti": ((46, 45.9526316, 0.0825), (47, 46.9517631, 0.0744), (48, 47.9479463, 0.7372),
+           (49, 48.9478700, 0.0541), (50, 49.9447912, 0.0518)),
+    "V": ((50, 49.9471585, 0.00250), (51, 50.9439595, 0.99750)),
+    "Cr": ((50, 49.9460442, 0.04345), (52, 51.9405075, 0.83789), (53, 52.9406494, 0.09501),
+           (54, 53.9388804, 0.02365)),
+    "Mn": ((55, 54.9380451, 1.0),),
+    "Fe": ((54, 53.9396105, 0.05845), (56, 55.9349375, 0.91754), (57, 56.9353940, 0.02119),
+           (58, 57.9332756, 0.00282)),
+    "Co": ((59, 58.9331950, 1.0),),
+    "Ni": ((58, 57.9353429, 0.680769), (60, 59.9307864, 0.262231), (61, 60.9310560, 0.011399),
+           (62, 61.9283451, 0.036345), (64, 63.9279660, 0.009256)),
+    "Cu": ((63, 62.9295975, 0.6915), (65, 64.9277895, 0.3085)),
+    "Zn": ((64, 63.9291422, 0.4917), (66, 65.9260334, 0.2773), (67, 66.9271273, 0.0404),
+           (68, 67.9248442, 0.1845), (70, 69.9253193, 0.0061)),
+    "Ga":((69, 68.9255736, 0.60108), (71, 70.9247013, 0.39892)),
+    "Ge":((70, 69.9242474, 0.2038), (72, 71.9220758, 0.2731), (73, 72.9234589, 0.0776),
+           (74, 73.9211778, 0.3672), (76, 75.9214026, 0.0783)),
+    "As": ((75, 74.9215965, 1.0),),
+    "Se": ((74, 73.9224764, 0.0089), (76, 75.9192136, 0.0937), (77, 76.9199140, 0.0763),
+           (78, 77.9173091, 0.2377), (80, 79.9165213, 0.4961), (82, 81.9166994, 0.0873)),
+    "Br": ((79, 78.9183371, 0.5069), (81, 80.9162906, 0.4931)),
+    "Kr":((78, 77.9203648, 0.00355), (80, 79.9163790, 0.02286), (82, 81.9134836, 0.11593),
+           (83, 82.914136, 0.11500), (84, 83.911507, 0.56987), (86, 85.91061073, 0.17279)),
+    "Rb":((85, 84.911789738, 0.7217), (87, 86.909180527, 0.2783)),
+    "Sr":((84, 83.913425, 0.0056), (86, 85.9092602, 0.0986), (87, 86.9088771, 0.0700),
+           (88, 87.9056121, 0.8258)),
+    "Y": ((89, 88.9058483, 1.0),),
+    "Zr":((90, 89.9047044, 0.5145), (91, 90.9056458, 0.1122), (92, 91.9050408, 0.1715),
+           (94, 93.9063152, 0.1738), (96, 95.9082734, 0.0280)),
+    "Nb":((93, 92.9063781, 1.0),),
+    "Mo": ((92, 91.906811, 0.1453), (94, 93.9050883, 0.0915), (95, 94.9058421, 0.1584),
+           (96, 95.9046795, 0.1667), (97, 96.9060215, 0.0960), (98, 97.9054082, 0.2439),
+           (100, 99.907477, 0.0982)),
+    "Ru":((96, 95.907598, 0.0554), (98, 97.905287, 0.0187), (99, 98.9059393, 0.1276),
+           (100, 99.9042195, 0.1260), (101, 100.9055821, 0.1706), (102, 101.9043493, 0.3155),
+           (104, 103.905433, 0.1862)),
+    "Rh":((103, 102.905504, 1.0),),
+    "Pd": ((102, 101.905609, 0.0102), (104, 103.904036, 0.1114), (105, 104.905085, 0.2233),
+           (106, 105.903486, 0.2733), (108, 107.903892, 0.2646), (110, 109.905153, 0.1172)),
+    "Ag": ((107, 106.905097, 0.51839), (109, 108.904752, 0.48161)),
+    "Cd":((106, 105.906459, 0.0125), (108, 107.904184, 0.0089), (110, 109.9030021, 0.1249),
+           (111, 110.9041781, 0.1280), (112, 111.9027578, 0.2413), (113, 112.9044017, 0.1222),
+           (114, 113.9033585, 0.2873), (116, 115.904756, 0.0749)),
+    "In":((113, 112.904058, 0.0429), (115, 114.903878, 0.9571)),
+    "Sn": ((112, 111.904818, 0.0097), (114, 113.902779, 0.0066), (115, 114.903342, 0.0034),
+           (116, 115.901741, 0.1454), (117, 116.902952, 0.0768), (118, 117.901603, 0.2422),
+           (119, 118.903308, 0.0859), (120, 119.9021947, 0.3258), (122, 121.9034390, 0.0463),
+           (124, 123.9052739, 0.0579)),
+    "Sb":((121, 120.9038157, 0.5721), (123, 122.9042140, 0.4279)),
+    "Te":((120, 119.904020, 0.0009), (122, 121.9030439, 0.0255), (123, 122.9042700, 0.0089),
+           (124, 123.9028179, 0.0474), (125, 124.9044307, 0.0707), (126, 125.9033117, 0.1884),
+           (128, 127.9044631, 0.3174), (130, 129.9062244, 0.3408)),
+    "I":  ((127, 126.904473, 1.0),),
+    "Xe":((124, 123.9058930, 0.000952), (126, 125.904274, 0.000890), (128, 127.9035313, 0.019102),
+           (129, 128.9047794, 0.264006), (130, 129.9035080, 0.040710), (131, 130.9050824, 0.212324),
+           (132, 131.9041535, 0.269086), (134, 133.9053945, 0.104357), (136, 135.907219, 0.088573)),
+    "Cs":((133, 132.905451933, 1.0),),
+    "Ba":((130, 129.9063208, 0.00106), (132, 131.9050613, 0.00101), (134, 133.9045084, 0.02417),
+           (135, 134.9056886, 0.06592), (136, 135.9045759, 0.07854), (137, 136.9058274, 0.11232),
+           (138, 137.9052472, 0.71698)),
+    "La":((138, 137.907112, 0.00090), (139, 138.9063533, 0.99910)),
+    "Ce":((136, 135.907172, 0.00185), (138, 137.905991, 0.00251), (140, 139.9054387, 0.88450),
+           (142, 141.909244, 0.11114)),
+    "Pr":((141, 140.9076528, 1.0),),
+    "Nd":((142, 141.9077233, 0.272), (143, 142.9098143, 0.122), (144, 143.9100873, 0.238),
+           (145, 144.9125736, 0.083), (146, 145.9131169, 0.172), (148, 147.916893, 0.057),
+           (150, 149.920891, 0.056)),
+    "Sm":((144, 143.911999, 0.0307), (147, 146.9148979, 0.1499), (148, 147.9148227, 0.1124),
+           (149, 148.9171847, 0.1382), (150, 149.9172755, 0.0738), (152, 151.9197324, 0.2675),
+           (154, 153.9222093, 0.2275)),
+    "Eu":((151, 150.9198502, 0.4781), (153, 152.9212303, 0.5219)),
+    "Gd":((152, 151.9197910, 0.0020), (154, 153.9208656, 0.0218), (155, 154.9226220, 0.1480),
+           (156, 155.9221227, 0.2047), (157, 156.9239601, 0.1565), (158, 157.9241039, 0.2484),
+           (160, 159.9270541, 0.2186)),
+    "Tb":((159, 158.9253468, 1.0),),
+    "Dy":((156, 155.924283, 0.00056), (158, 157.924409, 0.00095), (160, 159.9251975, 0.02329),
+           (161, 160.9269334, 0.18889), (162, 161.9267984, 0.25475), (163, 162.9287312, 0.24896),
+           (164, 163.9291748, 0.28260)),
+    "Ho":((165, 164.9303221, 1.0),),
+    "Er":((162, 161.928778, 0.00139), (164, 163.929200, 0.01601), (166, 165.9302931, 0.33503),
+           (167, 166.9320482, 0.22869), (168, 167.9323702, 0.26978), (170, 169.9354643, 0.14910)),
+    "Tm":((169, 168.9342133, 1.0),),
+    "Yb":((168, 167.933897, 0.0013), (170, 169.9347618, 0.0304), (171, 170.9363258, 0.1428),
+           (172, 171.9363815, 0.2183), (173, 172.9382108, 0.1613), (174, 173.9388621, 0.3183),
+           (176, 175.9425717, 0.1276)),
+    "Lu":((175, 174.9407718, 0.9741), (176, 175.9426863, 0.0259)),
+    "Hf":((174, 173.940046, 0.0016), (176, 175.9414086, 0.0526), (177, 176.9432207, 0.1860),
+           (178, 177.9436988, 0.2728), (179, 178.9458161, 0.1362), (180, 179.9465500, 0.3508)),
+    "Ta":((180, 179.9474648, 0.00012), (181, 180.9479958, 0.99988)),
+    "W": ((180, 179.946704, 0.0012), (182, 181.9482042, 0.2650), (183, 182.9502230, 0.1431),
+           (184, 183.9509312, 0.3064), (186, 185.9543641, 0.2843)),
+    "Re":((185, 184.9529550, 0.3740), (187, 186.9557531, 0.6260)),
+    "Os":((184, 183.9524891, 0.0002), (186, 185.9538382, 0.0159), (187, 186.9557505, 0.0196),
+           (188, 187.9558382, 0.1324), (189, 188.9581475, 0.1615), (190, 189.9584470, 0.2626),
+           (192, 191.9614807, 0.4078)),
+    "Ir":((191, 190.9605940, 0.373), (193, 192.9629264, 0.627)),
+    "Pt": ((190, 189.959932, 0.00014), (192, 191.9610380, 0.00782), (194, 193.9626803, 0.32967),
+           (195, 194.9647911, 0.33832), (196, 195.9649515, 0.25242), (198, 197.967893, 0.07163)),
+    "Au": ((197, 196.9665687, 1.0),),
+    "Hg": ((196, 195.965833, 0.0015), (198, 197.9667690, 0.0997), (199, 198.9682799, 0.1687),
+           (200, 199.9683260, 0.2310), (201, 200.9703023, 0.1318), (202, 201.9706430, 0.2986),
+           (204, 203.9734939, 0.0687)),
+    "Tl":((203, 202.9723442, 0.2952), (205, 204.9744275, 0.7048)),
+    "Pb":((204, 203.9730436, 0.014), (206, 205.9744653, 0.241), (207, 206.9758969, 0.221),
+           (208, 207.9766521, 0.524)),
+    "Bi":((209, 208.9803987, 1.0),),
+    "Th":((232, 232.0380553, 1.0),),
+    "Pa":((231, 231.0358840, 1.0),),
+    "U": ((234, 234.0409521, 0.000054), (235, 235.0439299, 0.007204), (238, 238.0507882, 0.992742)),
+})
+
+# Peaks of the fine isotope pattern are merged if their masses differ by less than 10^-_FINE_DIGITS u
+_FINE_DIGITS = 6
+
+
+# Returns the isotopes of an element or raises a ValueError if no isotope data is available
+def _isotopes(element):
+    isotopes = isotope_table.get(element)
+    if isotopes is None:
+        raise ValueError(
+            f"Invalid Element for Isotope Calculation (no isotope data for element '{element}')"
+        )
+    return isotopes
+
+
+# Returns the relative atomic mass of the most abundant isotope of an element
+def monoisotopic_element_mass(element):
+    return max(_isotopes(element), key=lambda isotope: isotope[2])[1]
+
+
+# Returns the monoisotopic mass of a composition (dictionary with element frequencies), i. e. the mass of the
+# molecule consisting of the most abundant isotope of every element
+def monoisotopic_mass(dict_element_freq):
+    return float(sum(freq * monoisotopic_element_mass(element) for element, freq in dict_element_freq.items()))
+
+
+# Convolutes two isotope distributions, i. e. tuples of (key, mass, probability) peaks, peaks with identical keys
+# are merged (with the probability-weighted mean mass), peaks below threshold (relative to the most intense peak)
+# are removed
+def _convolute(distribution, other_distribution, fine, threshold):
+    peaks = {}
+    for key, mass, probability in distribution:
+        for other_key, other_mass, other_probability in other_distribution:
+            combined_mass = mass + other_mass
+            combined_probability = probability * other_probability
+            combined_key = round(combined_mass, _FINE_DIGITS) if fine else key + other_key
+            peak = peaks.get(combined_key)
+            if peak is None:
+                peaks[combined_key] = [combined_probability * combined_mass, combined_probability]
+            else:
+                peak[0] += combined_probability * combined_mass
+                peak[1] += combined_probability
+    limit = max(probability for _, probability in peaks.values()) * threshold
+    return tuple((key, weighted_mass / probability, probability)
+                 for key, (weighted_mass, probability) in peaks.items() if probability >= limit)
+
+
+# Returns the isotope distribution of freq atoms of an element by repeated squaring of the distribution of a
+# single atom (cached, since the same element frequencies occur in many formulas)
+@functools.lru_cache(maxsize=4096)
+def _element_distribution(element, freq, fine, threshold):
+    distribution = ((0, 0.0, 1.0),)
+    power = tuple((mass_number, mass, abundance) for mass_number, mass, abundance in _isotopes(element))
+    while freq:
+        if freq & 1:
+            distribution = _convolute(distribution, power, fine, threshold)
+        freq >>= 1
+        if freq:
+            power = _convolute(power, power, fine, threshold)
+    return distribution
+
+
+# Returns the isotope pattern of a composition (dictionary with element frequencies) as a list of
+# (mass-to-charge ratio, probability) pairs in ascending order of their masses; the aggregated pattern (default)
+# combines all isotopologues with the same nucleon number, the fine pattern (fine=True) resolves isotopologues with
+# different exact masses; peaks below threshold (relative to the most intense peak) are pruned during the
+# calculation, mass-to-charge ratios of charged formulas are the masses divided by the absolute charge
+# (electron masses are neglected)
+def isotope_pattern(dict_element_freq, charge=0, threshold=1e-6, fine=False):
+    if not isinstance(threshold, (int, float)) or isinstance(threshold, bool) or not 0 <= threshold < 1:
+        raise ValueError(
+            f"Invalid Threshold '{threshold}' (expected a number between 0 and 1)"
+        )
+    distribution = ((0, 0.0, 1.0),)
+    for element, freq in sorted(dict_element_freq.items()):
+        if freq > 0:
+            distribution = _convolute(distribution, _element_distribution(element, freq, fine, threshold),
+                                      fine, threshold)
+    divisor = abs(charge) or 1
+    return sorted((mass / divisor, probability) for _, mass, probability in distribution)
+
+
+# Returns the isotope patterns of many compositions (dictionaries with element frequencies) or chemical formula
+# objects, the isotope distributions of the individual elements are shared between all formulas
+def isotope_patterns(formulas, threshold=1e-6, fine=False):
+    patterns = []
+    for formula in formulas:
+        if isinstance(formula, dict):
+            patterns.append(isotope_pattern(formula, 0, threshold, fine))
+        else:
+            patterns.append(isotope_pattern(formula.element, formula.charge, threshold, fine))
+    return patterns
@@ -0,0 +1,78 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+from .chemformula import ChemFormula
+
+
+# Returns the mass-to-charge ratio of a chemical formula object (formula weight / |charge|),
+# uncharged formulas are indexed by their formula weight
+def mass_to_charge(chemical_formula):
+    if chemical_formula.charge == 0:
+        return chemical_formula.formula_weight
+    return chemical_formula.formula_weight / abs(chemical_formula.charge)
+
+
+# Checks, whether the tolerance in parts per million (ppm) is valid
+def _check_ppm(ppm):
+    if not isinstance(ppm, (int, float)) or isinstance(ppm, bool):
+        raise TypeError(
+            f"Invalid Tolerance '{ppm}' (expected a number (<class 'int'> or <class 'float'>), but found {type(ppm)})"
+        )
+    if ppm < 0:
+        raise ValueError(
+            f"Invalid Tolerance '{ppm}' (expected a non-negative number)"
+        )
+    return ppm
+
+
+# Class for mass lookups in large collections of chemical formulas: the mass-to-charge ratios are stored in
+# ascending order in a contiguous array of doubles, lookups within a tolerance window use binary search
+class FormulaMassIndex:
+    def __init__(self, formulas):
+        chemical_formulas = [formula if isinstance(formula, ChemFormula) else ChemFormula(formula)
+                             for formula in formulas]
+        mass_to_charge_ratios = [mass_to_charge(chemical_formula) for chemical_formula in chemical_formulas]
+        order = sorted(range(len(chemical_formulas)), key=mass_to_charge_ratios.__getitem__)
+        self.__masses = array("d", [mass_to_charge_ratios[position] for position in order])
+        self.__formulas = tuple(chemical_formulas[position] for position in order)
+
+    # Returns the number of indexed formulas
+    def __len__(self):
+        return len(self.__formulas)
+
+    # Returns the indexed mass-to-charge ratios in ascending order (as a read-only memoryview of doubles)
+    @property
+    def masses(self):
+        return memoryview(self.__masses).toreadonly()
+
+    # Returns the indexed chemical formula objects in ascending order of their mass-to-charge ratios
+    @property
+    def formulas(self):
+        return self.__formulas
+
+    # Returns the positions of the first and behind the last entry within mass ± ppm, starting the search at lo
+    def _window(self, mass, ppm, lo=0):
+        tolerance = abs(mass) * ppm * 1e-6
+        first = bisect_left(self.__masses, mass - tolerance, lo)
+        return first, bisect_right(self.__masses, mass + tolerance, first)
+
+    # Returns all chemical formula objects with a mass-to-charge ratio within mass ± ppm (parts per million),
+    # in ascending order of their mass-to-charge ratios
+    def query(self, mass, ppm=5):
+        first, last = self._window(float(mass), _check_ppm(ppm))
+        return list(self.__formulas[first:last])
+
+    # Returns the matching chemical formula objects for many masses (e. g. a list or an array of peaks) as a list
+    # of lists in the order of the given masses, the masses are processed in ascending order, so that every binary
+    # search only covers the part of the index above the previous window
+    def query_many(self, masses, ppm=5):
+        _check_ppm(ppm)
+        masses = [float(mass) for mass in masses]
+        results = [None] * len(masses)
+        lo = 0
+        for position in sorted(range(len(masses)), key=masses.__getitem__):
+            first, last = self._window(masses[position], ppm, lo)
+            results[position] = list(self.__formulas[first:last])
+            if ppm < 1e6:  # the lower bounds of the windows only increase with the masses for tolerances below 100 %
+                lo = first
+        return results
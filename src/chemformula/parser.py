@@ -0,0 +1,205 @@
+import re
+from collections import namedtuple
+from time import perf_counter
+
+from . import elements, profiling
+from .cache import parse_cache
+
+# whitespaces, dots and asterisks (e. g. in "CuSO4 . 5 H2O") carry no information for the composition
+_SEPARATORS = re.compile(r"[\.\s\*]+")
+
+_OPENING_BRACKETS = "([{"
+_CLOSING_BRACKETS = ")]}"
+
+# position of every element symbol in elements.element_symbols (i. e. atomic number - 1)
+_ELEMENT_INDEX = elements.element_index
+
+# (element index, element frequency) pairs are interned and shared between compositions
+_COMPOSITION_PAIRS = {}
+_MAX_COMPOSITION_PAIRS = 65536
+
+
+# Reads the (optional) frequency digits starting at position, returns frequency and position after the digits
+def _read_frequency(formula, position, length):
+    start = position
+    while position < length and "0" <= formula[position] <= "9":
+        position += 1
+    if position == start:
+        return 1, position  # if no number is given, use a frequency of 1
+    return int(formula[start:position]), position
+
+
+# Kinds of formula errors and the corresponding error messages
+ERROR_MESSAGES = {
+    "double_lowercase": "Invalid Element Symbol (two lowercase letters found in sequence)",
+    "unknown_element": "Invalid Element Symbol (unknown element symbol '{token}')",
+    "unexpected_closing_bracket":
+        "Invalid Bracket Structure in Formula (expecting an opening bracket, but found a closing bracket)",
+    "unbalanced_brackets":
+        "Invalid Bracket Structure in Formula (inconsistent number of opening and closing brackets)",
+    "invalid_character": "Invalid Character in Formula (unexpected character '{token}')",
+}
+
+# Structured description of an invalid formula: kind of error (see ERROR_MESSAGES), position of the offending token
+# in the original formula string, the offending token and the error message
+FormulaError = namedtuple("FormulaError", ["kind", "position", "token", "message"])
+
+
+# Priorities of the errors, which do not end the scan: if a formula has several errors, bracket errors are reported
+# first, then two lowercase letters in sequence, then unknown element symbols, then invalid characters
+# (and the first error of a kind in the formula)
+_ERROR_PRIORITIES = {"double_lowercase": 0, "unknown_element": 1, "invalid_character": 2}
+
+
+# Returns the error to be reported of the error found so far and a new error
+def _first_error(error, new_error):
+    if error is None or _ERROR_PRIORITIES[new_error[0]] < _ERROR_PRIORITIES[error[0]]:
+        return new_error
+    return error
+
+
+# Scans a chemical formula (without separators) in a single pass without raising exceptions, returns the composition
+# as a dictionary with (key : value) = (element symbol : element frequency), with the element symbols in order of
+# first appearance, and None, or None and an (error kind, position, token) tuple for an invalid formula
+def _scan(formula):
+    length = len(formula)
+    # stack of compositions, one for every open bracket level, the bottom one holds the whole formula
+    stack = [{}]
+    bracket_positions = []
+    # first error with the highest priority (see _ERROR_PRIORITIES), bracket errors end the scan immediately
+    error = None
+    position = 0
+    while position < length:
+        character = formula[position]
+        if "A" <= character <= "Z":
+            # element symbol: one capital letter, possibly followed by one lower case letter
+            end = position + 1
+            if end < length and "a" <= formula[end] <= "z":
+                end += 1
+                if end < length and "a" <= formula[end] <= "z":
+                    error = _first_error(error, ("double_lowercase", position, formula[position:end + 1]))
+                    position = end + 1
+                    continue
+            element = formula[position:end]
+            if element not in elements.element_table:
+                error = _first_error(error, ("unknown_element", position, element))
+                position = end
+                continue
+            freq, position = _read_frequency(formula, end, length)
+            composition = stack[-1]
+            composition[element] = composition.get(element, 0) + freq
+        elif character in _OPENING_BRACKETS:
+            stack.append({})
+            bracket_positions.append(position)
+            position += 1
+        elif character in _CLOSING_BRACKETS:
+            if len(stack) == 1:  # there are more closing brackets than opening brackets during parsing formula
+                return None, ("unexpected_closing_bracket", position, character)
+            multiplier, position = _read_frequency(formula, position + 1, length)
+            # merge the bracketed unit into the enclosing unit, keeping the order of first appearance
+            bracketed_unit = stack.pop()
+            bracket_positions.pop()
+            composition = stack[-1]
+            for element, freq in bracketed_unit.items():
+                composition[element] = composition.get(element, 0) + freq * multiplier
+        elif "a" <= character <= "z":
+            if position + 1 < length and "a" <= formula[position + 1] <= "z":
+                error = _first_error(error, ("double_lowercase", position, formula[position:position + 2]))
+            position += 1  # a single lowercase letter without a preceding capital letter is ignored
+        elif "0" <= character <= "9":
+            position += 1  # digits without a preceding element symbol or bracket are ignored
+        else:
+            error = _first_error(error, ("invalid_character", position, character))
+            position += 1
+    if len(stack) > 1:  # number of opening brackets is not identical to the number of closing brackets
+        position = bracket_positions[-1]  # innermost opening bracket, which is not closed
+        return None, ("unbalanced_brackets", position, formula[position])
+    if error is not None:
+        return None, error
+    return stack[0], None
+
+
+# Parses a chemical formula in a single pass and returns the composition as a dictionary with
+# (key : value) = (element symbol : element frequency), with the element symbols in order of first appearance
+def parse_formula(formula):
+    composition, error = _scan(_SEPARATORS.sub("", formula))
+    if error is not None:
+        kind, _, token = error
+        raise ValueError(
+            ERROR_MESSAGES[kind].format(token=token)
+        )
+    return composition
+
+
+# Maps a position in the formula without separators back to the position in the original formula
+def _original_position(formula, position):
+    kept_characters = 0
+    for original_position, character in enumerate(formula):
+        if not _SEPARATORS.match(character):
+            if kept_characters == position:
+                return original_position
+            kept_characters += 1
+    return len(formula)
+
+
+# Checks many chemical formulas without raising exceptions, returns for every formula None if it is valid
+# or a FormulaError describing the first error; if details is False, only True (valid) or False (invalid)
+# is returned for every formula
+def validate_many(formulas, details=True):
+    results = []
+    for formula in formulas:
+        formula = str(formula)
+        _, error = _scan(_SEPARATORS.sub("", formula))
+        if not details:
+            results.append(error is None)
+        elif error is None:
+            results.append(None)
+        else:
+            kind, position, token = error
+            results.append(FormulaError(kind, _original_position(formula, position), token,
+                                        ERROR_MESSAGES[kind].format(token=token)))
+    return results
+
+
+# Parses a chemical formula and returns the composition as a tuple of (element index, element frequency) pairs,
+# the element index refers to elements.element_symbols
+def parse_composition(formula):
+    # look up the composition in the (opt-in) parse cache, which is keyed by the raw formula string
+    if parse_cache.maxsize:
+        composition = parse_cache.get(formula)
+        if composition is None:
+            composition = _parse_composition(formula)
+            parse_cache.put(formula, composition)
+        return composition
+    return _parse_composition(formula)
+
+
+def _parse_composition(formula):
+    if profiling.enabled:
+        start = perf_counter()
+        try:
+            composition = _intern_composition(parse_formula(formula))
+        except ValueError:
+            profiling.record("parse_error", start)
+            raise
+        profiling.record("parse", start)
+        return composition
+    return _intern_composition(parse_formula(formula))
+
+
+# Converts a composition dictionary into a tuple of interned (element index, element frequency) pairs
+def _intern_composition(dict_formula):
+    return intern_composition((_ELEMENT_INDEX[element], freq) for element, freq in dict_formula.items())
+
+
+# Returns (element index, element frequency) pairs as a composition, i. e. a tuple of interned pairs
+def intern_composition(index_freq_pairs):
+    composition = []
+    for pair in index_freq_pairs:
+        interned_pair = _COMPOSITION_PAIRS.get(pair)
+        if interned_pair is None:
+            if len(_COMPOSITION_PAIRS) < _MAX_COMPOSITION_PAIRS:
+                _COMPOSITION_PAIRS[pair] = pair
+            interned_pair = pair
+        composition.append(interned_pair)
+    return tuple(composition)
@@ -0,0 +1,190 @@
+import functools
+import os
+import sqlite3
+
+from . import elements
+from .bulk import ParseResult, _parse_one, map_chunks
+
+# Version of the database layout, the cache is emptied when the format version or the element table changes
+FORMAT_VERSION = 1
+
+# Number of new parse results, which are collected before they are written to the cache
+_WRITE_BATCH_SIZE = 10_000
+
+# Maximum number of formulas per lookup query (SQLite limits the number of query parameters)
+_MAX_QUERY_PARAMETERS = 500
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS parse_results (formula TEXT PRIMARY KEY, composition TEXT, hill_formula TEXT, "
+    "formula_weight REAL, error TEXT) WITHOUT ROWID",
+)
+
+
+# Returns the version stamp of the cache, i. e. the format version and the checksum of the element table
+def version_stamp():
+    return f"{FORMAT_VERSION}:{elements.element_table_checksum()}"
+
+
+# Encodes a composition (tuple of (element symbol, element frequency) pairs) as a string, e. g. "C 8 H 10 N 4 O 2"
+def _encode_composition(composition):
+    return " ".join(f"{element} {freq}" for element, freq in composition)
+
+
+# Decodes a composition string into a tuple of (element symbol, element frequency) pairs
+def _decode_composition(composition_string):
+    tokens = iter(composition_string.split())
+    return tuple((element, int(freq)) for element, freq in zip(tokens, tokens))
+
+
+def _parse_result(formula, composition_string, hill_formula, formula_weight, error):
+    if error is not None:
+        return ParseResult(formula, None, None, None, error)
+    return ParseResult(formula, _decode_composition(composition_string), hill_formula, formula_weight, None)
+
+
+# Class for a persistent parse cache in an SQLite database file, which stores the ParseResult (composition,
+# Hill formula and formula weight or error message) of every formula string, so that parse results survive process
+# restarts; the cache is emptied automatically, if it was written with a different element table (atomic weights)
+class PersistentParseCache:
+    def __init__(self, path):
+        self.__path = path
+        self.__connection = sqlite3.connect(path)
+        try:
+            self.__connection.execute("PRAGMA journal_mode=WAL")  # readers do not block the writer
+            with self.__connection:
+                for statement in _SCHEMA:
+                    self.__connection.execute(statement)
+                row = self.__connection.execute("SELECT value FROM metadata WHERE key = 'version'").fetchone()
+                if row is None or row[0] != version_stamp():
+                    self.__connection.execute("DELETE FROM parse_results")
+                    self.__connection.execute("INSERT OR REPLACE INTO metadata VALUES ('version', ?)",
+                                              (version_stamp(),))
+        except BaseException:
+            self.__connection.close()
+            raise
+        self.__hits = 0
+        self.__misses = 0
+
+    # Closes the database connection
+    def close(self):
+        self.__connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Returns the path of the database file
+    @property
+    def path(self):
+        return self.__path
+
+    # Returns the number of cached formulas
+    def __len__(self):
+        return self.__connection.execute("SELECT COUNT(*) FROM parse_results").fetchone()[0]
+
+    # Returns the number of cache hits and misses of lookups with this connection
+    @property
+    def hits(self):
+        return self.__hits
+
+    @property
+    def misses(self):
+        return self.__misses
+
+    # Returns the cached ParseResult of a formula string or None, if the formula string is not cached
+    def get(self, formula):
+        return self.get_many([formula]).get(formula)
+
+    # Returns the cached ParseResults of many formula strings as a dictionary with
+    # (key : value) = (formula string : ParseResult), formula strings which are not cached are missing
+    def get_many(self, formulas):
+        formulas = list(dict.fromkeys(formulas))
+        results = {}
+        for start in range(0, len(formulas), _MAX_QUERY_PARAMETERS):
+            batch = formulas[start:start + _MAX_QUERY_PARAMETERS]
+            rows = self.__connection.execute(
+                "SELECT formula, composition, hill_formula, formula_weight, error FROM parse_results "
+                f"WHERE formula IN ({', '.join('?' * len(batch))})", batch
+            )
+            for row in rows:
+                results[row[0]] = _parse_result(*row)
+        self.__hits += len(results)
+        self.__misses += len(formulas) - len(results)
+        return results
+
+    # Stores many ParseResults (existing entries are replaced)
+    def put_many(self, results):
+        with self.__connection:
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO parse_results VALUES (?, ?, ?, ?, ?)",
+                ((result.formula,
+                  None if result.composition is None else _encode_composition(result.composition),
+                  result.hill_formula, result.formula_weight, result.error) for result in results)
+            )
+
+    # Removes all entries
+    def clear(self):
+        with self.__connection:
+            self.__connection.execute("DELETE FROM parse_results")
+
+    # Returns the ParseResults of many formula strings in input order, formula strings which are not cached
+    # are parsed and added to the cache
+    def parse(self, formulas):
+        formulas = list(formulas)
+        results = self.get_many(formulas)
+        new_results = {}
+        for formula in formulas:
+            if formula not in results and formula not in new_results:
+                new_results[formula] = _parse_one(formula)
+        if new_results:
+            self.put_many(new_results.values())
+            results.update(new_results)
+        return [results[formula] for formula in formulas]
+
+
+# Open caches of the worker processes keyed by (process id, path), so that every worker process opens the cache once
+_worker_caches = {}
+
+
+def _worker_cache(path):
+    key = (os.getpid(), path)
+    cache = _worker_caches.get(key)
+    if cache is None:
+        cache = _worker_caches[key] = PersistentParseCache(path)
+    return cache
+
+
+# Looks up a chunk of formula strings and parses the formula strings which are not cached, returns
+# (ParseResult, new) pairs, new results are written by the calling process
+def _lookup_chunk(cache, formulas):
+    hits = cache.get_many(formulas)
+    return [(hits[formula], False) if formula in hits else (_parse_one(formula), True) for formula in formulas]
+
+
+# Looks up a chunk of formula strings (executed in the worker processes, which only read from the cache)
+def _lookup_chunk_in_worker(path, formulas):
+    return _lookup_chunk(_worker_cache(path), formulas)
+
+
+# Yields one ParseResult per formula in input order, cached results are read by the worker processes and new results
+# are written to the cache at path by the calling process (see bulk.parse_bulk)
+def parse_chunks(chunks, jobs, path):
+    with PersistentParseCache(path) as cache:  # empties an outdated cache before the worker processes read from it
+        if jobs == 1:
+            lookup = functools.partial(_lookup_chunk, cache)
+        else:
+            lookup = functools.partial(_lookup_chunk_in_worker, os.fspath(path))
+        new_results = []
+        try:
+            for result, new in map_chunks(lookup, chunks, jobs):
+                if new:
+                    new_results.append(result)
+                    if len(new_results) >= _WRITE_BATCH_SIZE:
+                        cache.put_many(new_results)
+                        new_results = []
+                yield result
+        finally:
+            cache.put_many(new_results)
@@ -0,0 +1,77 @@
+import threading
+from time import perf_counter
+
+# Opt-in instrumentation of the parsing and rendering pipeline: for every stage the number of calls and the
+# cumulative time are recorded while profiling is enabled, e. g.
+#
+#     from chemformula import profiling
+#     profiling.enable()
+#     ...
+#     profiling.snapshot()    # {"parse": {"calls": 1200, "seconds": 0.0123}, ...}
+#     profiling.prometheus()  # Prometheus text exposition format
+#
+# Stages: "parse" (cleanup, validation and bracket resolution of a formula), "parse_error" (parses that failed
+# with a ValueError), "element", "hill_formula", "sum_formula", "formula_weight", "mass_fraction" and the
+# renderers "format_formula", "latex", "html" and "unicode"; cached parse results and memoized values are not
+# recorded, so call counts show how often a value had to be computed
+
+# instrumented code checks this flag before taking any timings, so that profiling costs one attribute lookup
+# per stage when disabled
+enabled = False
+
+_lock = threading.Lock()
+_counters = {}
+
+
+# Enables profiling
+def enable():
+    global enabled
+    enabled = True
+
+
+# Disables profiling (recorded counters are kept until reset() is called)
+def disable():
+    global enabled
+    enabled = False
+
+
+# Removes all recorded counters
+def reset():
+    with _lock:
+        _counters.clear()
+
+
+# Records one call of stage, which started at start (time.perf_counter())
+def record(stage, start):
+    elapsed = perf_counter() - start
+    with _lock:
+        counter = _counters.get(stage)
+        if counter is None:
+            _counters[stage] = [1, elapsed]
+        else:
+            counter[0] += 1
+            counter[1] += elapsed
+
+
+# Returns the recorded counters as a dictionary with (key : value) = (stage : {"calls": ..., "seconds": ...})
+def snapshot():
+    with _lock:
+        return {stage: {"calls": calls, "seconds": seconds} for stage, (calls, seconds) in sorted(_counters.items())}
+
+
+# Returns the recorded counters in the Prometheus text exposition format
+def prometheus(prefix="chemformula"):
+    counters = snapshot()
+    lines = [
+        f"# HELP {prefix}_stage_calls_total Number of calls per pipeline stage.",
+        f"# TYPE {prefix}_stage_calls_total counter",
+    ]
+    lines += [f'{prefix}_stage_calls_total{{stage="{stage}"}} {counter["calls"]}'
+              for stage, counter in counters.items()]
+    lines += [
+        f"# HELP {prefix}_stage_seconds_total Cumulative time per pipeline stage in seconds.",
+        f"# TYPE {prefix}_stage_seconds_total counter",
+    ]
+    lines += [f'{prefix}_stage_seconds_total{{stage="{stage}"}} {counter["seconds"]!r}'
+              for stage, counter in counters.items()]
+    return "\n".join(lines) + "\n"
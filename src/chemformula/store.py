@@ -0,0 +1,242 @@
+'''
+BINARY FORMULA STORE
+compact on-disk format for large collections of parsed chemical formulas, which is read via mmap without parsing
+
+All integers and floats are stored in little-endian byte order. The file starts with a header (see _HEADER) followed
+by the sections listed in _SECTIONS, every section is a contiguous array of fixed-width values and starts at an
+offset which is a multiple of 8 (the section offsets are stored in the header):
+
+    pair_offsets   uint64[count + 1]      composition of formula i: pairs pair_offsets[i] to pair_offsets[i + 1] - 1
+    pair_elements  uint8[pairs]           element index of each (element, frequency) pair (see elements.element_symbols)
+    pair_counts    uint32[pairs]          element frequency of each (element, frequency) pair
+    charges        int32[count]           charge of each formula
+    weights        float64[count]         formula weight of each formula
+    hill_ranks     uint32[count]          rank of each formula in the lexical sorting according to Hill's notation
+    flags          uint8[count]           bit 0: formula has a name, bit 1: formula has a CAS registry number
+    string_offsets uint64[3 * count + 1]  Hill formula, name and CAS registry number of formula i are the strings
+                                          3 * i, 3 * i + 1 and 3 * i + 2 of the string heap
+    string_heap    bytes                  UTF-8 encoded strings
+
+The compositions are stored in Hill notation, so the pairs of a formula are its Hill sort key. The header contains
+a format version and a checksum of the element table (element symbols and atomic weights), stores written with a
+different format version or element table cannot be opened.
+'''
+
+import mmap
+import struct
+import sys
+from array import array
+
+from . import elements
+from .chemformula import ChemFormula
+
+FORMAT_VERSION = 1
+
+_MAGIC = b"CHEMFORM"
+_SECTIONS = ("pair_offsets", "pair_elements", "pair_counts", "charges", "weights", "hill_ranks", "flags",
+             "string_offsets", "string_heap")
+_TYPECODES = {"pair_offsets": "Q", "pair_elements": "B", "pair_counts": "I", "charges": "i", "weights": "d",
+              "hill_ranks": "I", "flags": "B", "string_offsets": "Q", "string_heap": "B"}
+# magic, format version, element table checksum, number of formulas, number of pairs, section offsets
+_HEADER = struct.Struct(f"<8sIIQQ{len(_SECTIONS)}Q")
+
+_HAS_NAME = 1
+_HAS_CAS = 2
+
+
+def _check_byteorder():
+    if sys.byteorder != "little":
+        raise OSError(
+            "Invalid Byte Order (formula stores can only be used on little-endian platforms)"
+        )
+
+
+# Writes chemical formula objects (or formula strings) to a formula store file, returns the number of formulas
+def write_store(formulas, path):
+    _check_byteorder()
+    chemical_formulas = [formula if isinstance(formula, ChemFormula) else ChemFormula(formula)
+                         for formula in formulas]
+    sections = {section: array(_TYPECODES[section]) for section in _SECTIONS}
+    sections["pair_offsets"].append(0)
+    sections["string_offsets"].append(0)
+    string_heap = bytearray()
+    for chemical_formula in chemical_formulas:
+        hill_composition = chemical_formula._hill_composition()
+        for element, freq in hill_composition:
+            if not 0 <= freq <= 0xFFFFFFFF:
+                raise ValueError(
+                    f"Invalid Element Frequency '{freq}' (formula stores hold frequencies between 0 and 4294967295)"
+                )
+            sections["pair_elements"].append(elements.element_index[element])
+            sections["pair_counts"].append(freq)
+        sections["pair_offsets"].append(len(sections["pair_elements"]))
+        if not -0x80000000 <= chemical_formula.charge <= 0x7FFFFFFF:
+            raise ValueError(
+                f"Invalid Charge '{chemical_formula.charge}' "
+                "(formula stores hold charges between -2147483648 and 2147483647)"
+            )
+        sections["charges"].append(chemical_formula.charge)
+        sections["weights"].append(chemical_formula.formula_weight)
+        name = chemical_formula._name()
+        cas = chemical_formula.cas
+        sections["flags"].append((0 if name is None else _HAS_NAME) | (0 if cas is None else _HAS_CAS))
+        for string in (str(chemical_formula.hill_formula), name or "", "" if cas is None else str(cas)):
+            string_heap += string.encode("utf-8")
+            sections["string_offsets"].append(len(string_heap))
+    # equal Hill sort keys share the same rank
+    hill_ranks = [0] * len(chemical_formulas)
+    rank, previous_key = -1, None
+    for position in sorted(range(len(chemical_formulas)), key=lambda position: chemical_formulas[position]):
+        hill_sort_key = chemical_formulas[position].hill_sort_key
+        if hill_sort_key != previous_key:
+            rank, previous_key = rank + 1, hill_sort_key
+        hill_ranks[position] = rank
+    sections["hill_ranks"].extend(hill_ranks)
+    sections["string_heap"] = string_heap
+
+    offsets = []
+    position = _HEADER.size
+    for section in _SECTIONS:
+        position += -position % 8
+        offsets.append(position)
+        position += len(sections[section]) * (1 if section == "string_heap" else sections[section].itemsize)
+    with open(path, "wb") as store_file:
+        store_file.write(_HEADER.pack(_MAGIC, FORMAT_VERSION, elements.element_table_checksum(), len(chemical_formulas),
+                                      len(sections["pair_elements"]), *offsets))
+        for section, offset in zip(_SECTIONS, offsets):
+            store_file.write(b"\0" * (offset - store_file.tell()))
+            store_file.write(bytes(sections[section]))
+    return len(chemical_formulas)
+
+
+# Class for read-only access to a formula store file, the file is memory-mapped, so that all columns are
+# zero-copy views and several processes share one copy in the page cache
+class FormulaStore:
+    def __init__(self, path):
+        _check_byteorder()
+        with open(path, "rb") as store_file:
+            self.__mmap = mmap.mmap(store_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__view = memoryview(self.__mmap)
+        self.__sections = {}
+        try:
+            self.__open_sections()
+        except BaseException:
+            self.close()
+            raise
+
+    def __open_sections(self):
+        if len(self.__mmap) < _HEADER.size:
+            raise ValueError(
+                "Invalid Formula Store (file is too short)"
+            )
+        magic, version, checksum, count, pairs, *offsets = _HEADER.unpack_from(self.__mmap)
+        if magic != _MAGIC:
+            raise ValueError(
+                "Invalid Formula Store (file is not a formula store)"
+            )
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"Invalid Formula Store (expected format version {FORMAT_VERSION}, but found {version})"
+            )
+        if checksum != elements.element_table_checksum():
+            raise ValueError(
+                "Invalid Formula Store (the store was written with a different element table)"
+            )
+        lengths = {"pair_offsets": count + 1, "pair_elements": pairs, "pair_counts": pairs,
+                   "string_offsets": 3 * count + 1}
+        self.__count = count
+        for section, offset in zip(_SECTIONS, offsets):
+            typecode = _TYPECODES[section]
+            if section == "string_heap":
+                length = len(self.__mmap) - offset
+            else:
+                length = lengths.get(section, count) * struct.calcsize(typecode)
+            if offset + length > len(self.__mmap):
+                raise ValueError(
+                    f"Invalid Formula Store (section {section} exceeds the file)"
+                )
+            self.__sections[section] = self.__view[offset:offset + length].cast(typecode)
+
+    # Closes the memory-mapped file, views returned by the store, which are still in use (e. g. slices of columns
+    # or NumPy arrays created from columns), remain valid and the file is unmapped when the last of them is released
+    def close(self):
+        for section_view in (*self.__sections.values(), self.__view):
+            try:
+                section_view.release()
+            except BufferError:  # the view is exported (e. g. to a NumPy array) and released with its last export
+                pass
+        self.__sections = {}
+        try:
+            self.__mmap.close()
+        except BufferError:  # views are still in use, the mmap object unmaps the file when it is garbage collected
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Returns the number of stored formulas
+    def __len__(self):
+        return self.__count
+
+    # Returns the formula weights of all formulas (as a zero-copy memoryview of doubles)
+    @property
+    def formula_weights(self):
+        return self.__sections["weights"][:]
+
+    # Returns the charges of all formulas (as a zero-copy memoryview of integers)
+    @property
+    def charges(self):
+        return self.__sections["charges"][:]
+
+    # Returns the ranks of all formulas in the lexical sorting according to Hill's notation
+    # (as a zero-copy memoryview of integers), formulas with equal Hill sort keys have the same rank
+    @property
+    def hill_ranks(self):
+        return self.__sections["hill_ranks"][:]
+
+    def _check_position(self, position):
+        if not -self.__count <= position < self.__count:
+            raise IndexError(
+                f"Invalid Position '{position}' (formula store holds {self.__count} formulas)"
+            )
+        return position % self.__count
+
+    def _string(self, position, field):
+        string_index = 3 * position + field
+        start = self.__sections["string_offsets"][string_index]
+        end = self.__sections["string_offsets"][string_index + 1]
+        return bytes(self.__sections["string_heap"][start:end]).decode("utf-8")
+
+    # Returns the composition of a formula as a tuple of (element index, element frequency) pairs in Hill notation
+    def composition(self, position):
+        position = self._check_position(position)
+        start = self.__sections["pair_offsets"][position]
+        end = self.__sections["pair_offsets"][position + 1]
+        return tuple(zip(self.__sections["pair_elements"][start:end], self.__sections["pair_counts"][start:end]))
+
+    # Returns the formula as a dictionary with (key : value) = (element symbol : element frequency) in Hill notation
+    def element(self, position):
+        return {elements.element_symbols[index]: freq for index, freq in self.composition(position)}
+
+    # Returns the sum formula of a formula in Hill notation as a string
+    def hill_formula(self, position):
+        return self._string(self._check_position(position), 0)
+
+    # Returns the name of a formula (None if the formula has no name)
+    def name(self, position):
+        position = self._check_position(position)
+        return self._string(position, 1) if self.__sections["flags"][position] & _HAS_NAME else None
+
+    # Returns the CAS registry number of a formula as a string (None if the formula has no CAS registry number)
+    def cas(self, position):
+        position = self._check_position(position)
+        return self._string(position, 2) if self.__sections["flags"][position] & _HAS_CAS else None
+
+    # Returns the formula as a chemical formula object (in Hill notation, created without parsing)
+    def __getitem__(self, position):
+        position = self._check_position(position)
+        return ChemFormula._from_composition(self.composition(position), self.__sections["charges"][position],
+                                             self.name(position), self.cas(position))
@@ -0,0 +1,82 @@
+import pytest
+
+from chemformula import ChemFormula
+
+# pytest fixtures
+
+
+@pytest.fixture
+def isopropanol():
+    return ChemFormula("(CH3)2CHOH", name="Isopropanol", cas=67_63_0)
+
+
+@pytest.fixture
+def sulfate():
+    return ChemFormula("SO4", charge=-2)
+
+
+# Tests for functionality
+
+
+def test_add(isopropanol):
+    result = isopropanol + ChemFormula("H2O")
+    assert result == ChemFormula("C3H10O2")
+    assert str(result) == "C3H10O2"
+    assert str(result.hill_formula) == "C3H10O2"
+    assert result.formula_weight == pytest.approx(78.111)
+    assert result.name == "None"
+    assert result.cas is None
+
+
+def test_add_charges(sulfate):
+    result = ChemFormula("Na", charge=1) + ChemFormula("Na", charge=1) + sulfate
+    assert result == ChemFormula("Na2SO4")
+    assert result.charged is False
+
+
+def test_subtract(isopropanol):
+    result = isopropanol - ChemFormula("H2O")
+    assert result == ChemFormula("C3H6")
+    assert result.element == {"C": 3, "H": 6}
+    assert (ChemFormula("H3O", charge=1) - ChemFormula("H", charge=1)) == ChemFormula("H2O")
+
+
+def test_subtract_all(isopropanol):
+    result = isopropanol - ChemFormula("C3H8O")
+    assert str(result) == ""
+    assert result.formula_weight == 0.0
+
+
+@pytest.mark.parametrize(
+    "factor, expected",
+    [
+        (0, ChemFormula("")),
+        (1, ChemFormula("SO4", charge=-2)),
+        (3, ChemFormula("S3O12", charge=-6)),
+    ],
+)
+def test_multiply(sulfate, factor, expected):
+    assert sulfate * factor == expected
+    assert factor * sulfate == expected
+
+
+def test_unsupported_operands(isopropanol):
+    with pytest.raises(TypeError):
+        isopropanol + "H2O"
+    with pytest.raises(TypeError):
+        isopropanol * 1.5
+    with pytest.raises(TypeError):
+        isopropanol * True
+
+
+# Tests for failure
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_subtract_negative_frequency(isopropanol):
+    isopropanol - ChemFormula("H2O2")
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_multiply_negative(sulfate):
+    sulfate * -1
@@ -0,0 +1,84 @@
+import pytest
+
+from chemformula import ChemFormula, ChemFormulaBatch
+
+numpy = pytest.importorskip("numpy")
+
+# pytest fixtures
+
+
+@pytest.fixture
+def batch():
+    return ChemFormulaBatch(
+        ["C8H10N4O2", "((CH3)3N)(C6H11O2)", "SO4", "UO2"], charges=[0, 1, -2, 0]
+    )
+
+
+# Tests for functionality
+
+
+def test_length(batch):
+    assert len(batch) == 4
+
+
+def test_counts_shape(batch):
+    assert batch.counts.shape == (4, 118)
+
+
+def test_element(batch):
+    assert list(batch.element("N")) == [4, 1, 0, 0]
+
+
+def test_charges(batch):
+    assert list(batch.charges) == [0, 1, -2, 0]
+
+
+def test_formula_weight(batch):
+    expected = [ChemFormula(formula).formula_weight for formula in batch.formulas]
+    assert numpy.allclose(batch.formula_weight, expected)
+
+
+def test_mass_fraction(batch):
+    column = batch.symbols.index("S")
+    assert round(batch.mass_fraction[2, column] * 100, 2) == 33.38
+    assert numpy.allclose(batch.mass_fraction.sum(axis=1), 1.0)
+
+
+def test_radioactive(batch):
+    assert list(batch.radioactive) == [False, False, False, True]
+
+
+def test_getitem(batch):
+    assert batch[1] == ChemFormula("C9H20NO2", charge=1)
+
+
+def test_counts_read_only(batch):
+    with pytest.raises(ValueError):
+        batch.counts[0, 0] = 1
+
+
+def test_empty_batch():
+    assert ChemFormulaBatch([]).formula_weight.shape == (0,)
+
+
+# Tests for error handling
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_charges_length():
+    ChemFormulaBatch(["H2O", "H3O"], charges=[0])
+
+
+@pytest.mark.xfail(raises=TypeError)
+def test_charges_type():
+    ChemFormulaBatch(["H3O"], charges=["+"])
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_formula():
+    ChemFormulaBatch(["H2O", "XyO"])
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_unknown_element():
+    ChemFormulaBatch(["H2O"]).element("Xy")
@@ -0,0 +1,72 @@
+import pickle
+
+import pytest
+
+from chemformula import ChemFormula
+from chemformula.bulk import ParseResult, parse_bulk
+
+# pytest fixtures
+
+
+@pytest.fixture
+def formulas():
+    return ["C8H10N4O2", "XyO", "((CH3)3N)(C6H11O2)", "H2)O", "CaCO3"] * 5
+
+
+@pytest.fixture
+def formula_file(tmp_path, formulas):
+    path = tmp_path / "formulas.txt"
+    path.write_text("\n".join(formulas) + "\n\n", encoding="utf-8")
+    return path
+
+
+# Tests for functionality
+
+
+def test_parse_result():
+    (result,) = parse_bulk(["CaCO3"], jobs=1)
+    assert result == ParseResult(
+        "CaCO3",
+        (("Ca", 1), ("C", 1), ("O", 3)),
+        "CCaO3",
+        ChemFormula("CaCO3").formula_weight,
+        None,
+    )
+
+
+def test_invalid_formula():
+    (result,) = parse_bulk(["XyO"], jobs=1)
+    assert result.composition is None
+    assert result.error == "Invalid Element Symbol (unknown element symbol 'Xy')"
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_input_order(formulas, jobs):
+    results = list(parse_bulk(formulas, jobs=jobs, chunksize=2))
+    assert [result.formula for result in results] == formulas
+    assert [result.error is None for result in results] == [
+        True, False, True, False, True
+    ] * 5
+
+
+def test_file(formula_file, formulas):
+    results = list(parse_bulk(formula_file, jobs=2, chunksize=3))
+    assert [result.formula for result in results] == formulas
+
+
+def test_picklable():
+    results = list(parse_bulk(["C8H10N4O2", "XyO"], jobs=1))
+    assert pickle.loads(pickle.dumps(results)) == results
+
+
+# Tests for error handling
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_jobs():
+    parse_bulk(["H2O"], jobs=0)
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_chunksize():
+    parse_bulk(["H2O"], chunksize=0)
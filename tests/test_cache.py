@@ -0,0 +1,84 @@
+import pytest
+
+from chemformula import (
+    ChemFormula,
+    clear_parse_cache,
+    disable_parse_cache,
+    enable_parse_cache,
+    parse_cache_info,
+)
+
+# pytest fixtures
+
+
+@pytest.fixture
+def parse_cache():
+    enable_parse_cache(maxsize=2)
+    clear_parse_cache()
+    yield
+    disable_parse_cache()
+
+
+# Tests for functionality
+
+
+def test_disabled_by_default():
+    ChemFormula("H2O")
+    assert parse_cache_info() == (0, 0, 0, 0)
+
+
+def test_hits_and_misses(parse_cache):
+    ChemFormula("H2O")
+    ChemFormula("H2O", charge=0, name="Water")
+    ChemFormula("C6H6")
+    info = parse_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_cached_composition(parse_cache):
+    water = ChemFormula("H2O")
+    assert ChemFormula("H2O", name="Water").element == water.element
+
+
+def test_least_recently_used(parse_cache):
+    ChemFormula("H2O")
+    ChemFormula("C6H6")
+    ChemFormula("H2O")
+    ChemFormula("NaCl")  # removes "C6H6"
+    ChemFormula("C6H6")
+    assert parse_cache_info().misses == 4
+
+
+def test_resize(parse_cache):
+    ChemFormula("H2O")
+    ChemFormula("C6H6")
+    enable_parse_cache(maxsize=1)
+    assert parse_cache_info().currsize == 1
+
+
+def test_clear(parse_cache):
+    ChemFormula("H2O")
+    clear_parse_cache()
+    assert parse_cache_info() == (0, 0, 2, 0)
+
+
+# Tests for error handling
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_formula_not_cached(parse_cache):
+    try:
+        ChemFormula("XyO")
+    finally:
+        assert parse_cache_info().currsize == 0
+    ChemFormula("XyO")
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_negative_size():
+    enable_parse_cache(maxsize=-1)
+
+
+@pytest.mark.xfail(raises=TypeError)
+def test_invalid_size_type():
+    enable_parse_cache(maxsize=1.5)
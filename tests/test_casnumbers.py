@@ -0,0 +1,78 @@
+import subprocess
+import sys
+
+import pytest
+
+from chemformula import ChemFormula, validate_cas_numbers
+from chemformula.casnumbers import cas_cache
+
+# Tests for functionality
+
+
+def test_cas_cache():
+    cas_cache.clear()
+    caffeine = ChemFormula("C8H10N4O2", name="caffeine", cas="58-08-2")
+    theine = ChemFormula("(C5N4H)O2(CH3)3", name="theine", cas=58082)
+    assert caffeine.cas is not theine.cas
+    assert caffeine.cas == theine.cas
+    # the cache is keyed by the CAS registry number as an integer
+    assert (cas_cache.info().misses, cas_cache.info().currsize) == (1, 1)
+
+
+def test_changed_cas_object():
+    caffeine = ChemFormula("C8H10N4O2", name="caffeine", cas="58-08-2")
+    theine = ChemFormula("(C5N4H)O2(CH3)3", name="theine", cas="58-08-2")
+    key = hash(caffeine)
+    caffeine.cas.cas_string = "64-17-5"
+    assert str(caffeine.cas) == "64-17-5"
+    assert str(theine.cas) == "58-08-2"
+    assert str(ChemFormula("C8H10N4O2", cas="58-08-2").cas) == "58-08-2"
+    assert hash(caffeine) == key
+    assert caffeine == theine
+
+
+@pytest.mark.parametrize(
+    "inputs",
+    [("0058-08-2", 58082, "58-08-2"), (58082, "0058-08-2", "58-08-2"), ("58-08-2", "0058-08-2", 58082)],
+)
+def test_canonical_cas_string(inputs):
+    cas_cache.clear()
+    for cas in inputs:
+        assert ChemFormula("C8H10N4O2", cas=cas).cas.cas_string == "58-08-2"
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_trailing_newline(cached):
+    cas_cache.clear()
+    if cached:
+        ChemFormula("C8H10N4O2", cas=58082)
+    with pytest.raises(ValueError):
+        ChemFormula("C8H10N4O2", cas="58-08-2\n")
+
+
+def test_lazy_cas():
+    water = ChemFormula("H2O", name="Water", cas="64-17-6", lazy=True)  # invalid check digit
+    assert water.name == "Water"
+    with pytest.raises(ValueError):
+        assert water.cas
+
+
+def test_lazy_cas_valid():
+    water = ChemFormula("H2O", name="Water", cas=7732_18_5, lazy=True)
+    assert str(water.cas) == "7732-18-5"
+    assert water == ChemFormula("H2O", cas="7732-18-5")
+
+
+def test_validate_cas_numbers():
+    results = validate_cas_numbers(["58-08-2", 58_08_2, "64-17-6", "", None, 6417.5])
+    assert [str(result.cas) for result in results[:2]] == ["58-08-2", "58-08-2"]
+    assert results[2].cas is None and "64-17-6" in results[2].error
+    assert results[3] == ("", None, None)
+    assert results[4] == (None, None, None)
+    assert results[5].error is not None
+
+
+def test_casregnum_imported_lazily():
+    code = "import sys, chemformula; print('casregnum' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"
@@ -0,0 +1,74 @@
+import pytest
+
+from chemformula.cli import main
+
+# pytest fixtures
+
+
+@pytest.fixture
+def formula_file(tmp_path):
+    path = tmp_path / "formulas.txt"
+    path.write_text("C8H10N4O2\nSO4\n\nUO2\n", encoding="utf-8")
+    return path
+
+
+# Tests for functionality
+
+
+def test_default_properties(formula_file, capsys):
+    assert main([str(formula_file), "--quiet"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split("\t")[:2] == ["C8H10N4O2", "C8H10N4O2"]
+    assert round(float(lines[0].split("\t")[2]), 2) == 194.19
+    assert len(lines) == 3
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_selected_properties(formula_file, tmp_path, jobs):
+    output = tmp_path / "output.tsv"
+    arguments = [str(formula_file), "-o", str(output), "-j", jobs, "--chunksize", "1"]
+    arguments += ["-p", "hill_formula", "-p", "unicode", "-p", "radioactive", "--header"]
+    assert main(arguments + ["-q"]) == 0
+    assert output.read_text(encoding="utf-8").splitlines() == [
+        "formula\thill_formula\tunicode\tradioactive",
+        "C8H10N4O2\tC8H10N4O2\tC₈H₁₀N₄O₂\tFalse",
+        "SO4\tO4S\tSO₄\tFalse",
+        "UO2\tO2U\tUO₂\tTrue",
+    ]
+
+
+def test_invalid_formula(tmp_path, capsys):
+    path = tmp_path / "formulas.txt"
+    path.write_text("H2O\nXyO\n", encoding="utf-8")
+    assert main([str(path), "-p", "html"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out.splitlines()[1] == "XyO\t"
+    assert "XyO: Invalid Element Symbol (unknown element symbol 'Xy')" in captured.err
+    assert "2 formulas (1 invalid)" in captured.err
+
+
+# Tests for error handling
+
+
+def test_invalid_jobs(formula_file):
+    with pytest.raises(SystemExit):
+        main([str(formula_file), "--jobs", "0"])
+
+
+def test_invalid_property(formula_file):
+    with pytest.raises(SystemExit):
+        main([str(formula_file), "-p", "name"])
+
+
+def test_missing_input_file(tmp_path, capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        main([str(tmp_path / "missing.txt")])
+    assert exc_info.value.code == 2
+    assert "can't open" in capsys.readouterr().err
+
+
+def test_invalid_output_file(formula_file, tmp_path, capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        main([str(formula_file), "-o", str(tmp_path / "missing" / "output.tsv")])
+    assert exc_info.value.code == 2
+    assert "can't open" in capsys.readouterr().err
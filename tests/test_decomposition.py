@@ -0,0 +1,95 @@
+import pytest
+
+from chemformula import ChemFormula, decompose_mass
+from chemformula.decomposition import rdbe
+
+# Tests for functionality
+
+
+def test_glucose():
+    glucose = ChemFormula("C6H12O6")
+    candidates = decompose_mass(glucose.formula_weight, ppm=1, element_ranges={"C": (0, 10), "H": (0, 20), "O": (0, 10)})
+    assert candidates == [glucose]
+    assert str(candidates[0]) == "C6H12O6"
+
+
+def test_all_candidates_within_tolerance():
+    candidates = decompose_mass(300.1, ppm=50)
+    assert len(candidates) > 0
+    assert all(abs(candidate.formula_weight - 300.1) <= 300.1 * 50e-6 for candidate in candidates)
+    deviations = [abs(candidate.formula_weight - 300.1) for candidate in candidates]
+    assert all(deviation <= next_deviation + 1e-9 for deviation, next_deviation in zip(deviations, deviations[1:]))
+
+
+def test_brute_force():
+    element_ranges = {"C": (1, 8), "H": (0, 18), "N": (0, 3), "O": (0, 5)}
+    weights = {"C": 12.011, "H": 1.008, "N": 14.007, "O": 15.999}
+    expected = set()
+    for c in range(1, 9):
+        for h in range(19):
+            for n in range(4):
+                for o in range(6):
+                    mass = c * weights["C"] + h * weights["H"] + n * weights["N"] + o * weights["O"]
+                    if abs(mass - 150.0) <= 150.0 * 1000e-6:
+                        counts = {"C": c, "H": h, "N": n, "O": o}
+                        expected.add(ChemFormula("".join(f"{element}{freq}" for element, freq in counts.items() if freq)))
+    assert set(decompose_mass(150.0, ppm=1000, element_ranges=element_ranges)) == expected
+
+
+def test_hill_notation():
+    candidates = decompose_mass(ChemFormula("C2H5Cl").formula_weight, ppm=1,
+                                element_ranges={"Cl": (1, 1), "H": (0, 10), "C": (0, 5)})
+    assert [str(candidate) for candidate in candidates] == ["C2H5Cl"]
+
+
+def test_charge():
+    sulfate = ChemFormula("SO4", charge=-2)
+    candidates = decompose_mass(sulfate.formula_weight / 2, ppm=1, element_ranges={"S": (0, 2), "O": (0, 8)}, charge=-2)
+    assert candidates == [sulfate]
+    assert candidates[0].charge == -2
+
+
+@pytest.mark.parametrize(
+    "testinput, expected",
+    [
+        ({"C": 6, "H": 6}, 4.0),
+        ({"C": 6, "H": 12, "O": 6}, 1.0),
+        ({"C": 5, "H": 5, "N": 1}, 4.0),
+    ],
+)
+def test_rdbe(testinput, expected):
+    assert rdbe(testinput) == expected
+
+
+def test_rdbe_filter():
+    benzene = ChemFormula("C6H6")
+    element_ranges = {"C": (0, 10), "H": (0, 20)}
+    assert benzene in decompose_mass(benzene.formula_weight, ppm=100, element_ranges=element_ranges)
+    assert decompose_mass(benzene.formula_weight, ppm=100, element_ranges=element_ranges, rdbe_range=(0, 3)) == []
+
+
+def test_no_candidates():
+    assert decompose_mass(10.0, ppm=5, element_ranges={"C": (1, None)}) == []
+
+
+# Tests for failure
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_mass():
+    decompose_mass(-18.0)
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_unknown_element():
+    decompose_mass(18.0, element_ranges={"Xy": (0, 2)})
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_range():
+    decompose_mass(18.0, element_ranges={"H": (3, 2)})
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_rdbe_unknown_valence():
+    decompose_mass(18.0, element_ranges={"H": (0, 2), "Fe": (0, 1)}, rdbe_range=(0, None))
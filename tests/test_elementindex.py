@@ -0,0 +1,63 @@
+import pytest
+
+from chemformula import ChemFormula, FormulaElementIndex
+
+# pytest fixtures
+
+
+@pytest.fixture
+def element_index():
+    return FormulaElementIndex([
+        "C6H5Cl",                                             # 0
+        "NaCl",                                               # 1
+        ChemFormula("C10H7Cl", name="1-Chloronaphthalene"),   # 2
+        "C12H22O11",                                          # 3
+        "CH2Cl2",                                             # 4
+        "[Cu(NH3)4]SO4.H2O",                                  # 5
+        "H2O",                                                # 6
+    ])
+
+
+# Tests for functionality
+
+
+@pytest.mark.parametrize(
+    "contains, excludes, counts, expected",
+    [
+        (["Cl"], [], None, [0, 1, 2, 4]),
+        ("Cl", ["Na", "Cu"], {"C": (5, 10)}, [0, 2]),
+        ([], ["C"], None, [1, 5, 6]),
+        ([], [], {"C": (None, 1)}, [1, 4, 5, 6]),
+        ([], [], {"C": (0, 0)}, [1, 5, 6]),
+        ([], [], {"H": (2, None), "O": (1, 5)}, [5, 6]),
+        ([], [], {"C": (10, 6)}, []),
+        (["Xe"], [], None, []),
+        ([], ["Xe"], {"Xe": (None, None)}, [0, 1, 2, 3, 4, 5, 6]),
+    ],
+)
+def test_positions(element_index, contains, excludes, counts, expected):
+    assert element_index.positions(contains, excludes, counts) == expected
+    assert element_index.count(contains, excludes, counts) == len(expected)
+
+
+def test_query(element_index):
+    result = element_index.query(contains=["Cl"], counts={"C": (10, 10)})
+    assert [formula.name for formula in result] == ["1-Chloronaphthalene"]
+
+
+def test_mask(element_index):
+    assert element_index.mask(contains="Na") == 0b10
+    assert element_index.mask() == 0b1111111
+
+
+def test_empty_index():
+    assert len(FormulaElementIndex([])) == 0
+    assert FormulaElementIndex([]).query(contains="C") == []
+
+
+# Tests for failure
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_unknown_element(element_index):
+    element_index.query(contains=["Xy"])
@@ -0,0 +1,63 @@
+import pytest
+
+from chemformula import elements
+
+# Tests for functionality
+
+
+@pytest.mark.parametrize(
+    "testinput, expected",
+    [
+        ("H", 1),
+        ("C", 6),
+        ("Fe", 26),
+        ("U", 92),
+        ("Og", 118),
+    ],
+)
+def test_atomic_number(testinput, expected):
+    assert elements.lookup(testinput).atomic_number == expected
+
+
+@pytest.mark.parametrize(
+    "testinput, expected",
+    [
+        ("C", 12.011),
+        ("Tc", 97.0),
+    ],
+)
+def test_atomic_weight(testinput, expected):
+    assert elements.atomic_weight(testinput) == expected
+    assert elements.lookup(testinput).atomic_weight == expected
+
+
+@pytest.mark.parametrize(
+    "testinput, expected",
+    [
+        ("U", True),
+        ("Tc", True),
+        ("Pb", False),
+    ],
+)
+def test_radioactive(testinput, expected):
+    assert elements.radioactive_element(testinput) is expected
+    assert elements.lookup(testinput).radioactive is expected
+
+
+def test_element_symbols():
+    assert len(elements.element_symbols) == 118
+    assert elements.element_symbols[:3] == ("H", "He", "Li")
+
+
+def test_unknown_element():
+    assert elements.lookup("Xy") is None
+    assert elements.atomic_weight("Xy") is False
+    assert elements.radioactive_element("Xy") is False
+
+
+# Tests for error handling
+
+
+@pytest.mark.xfail(raises=TypeError)
+def test_element_table_immutable():
+    elements.element_table["Xy"] = None
@@ -0,0 +1,77 @@
+import pytest
+
+from chemformula import (
+    ChemFormula,
+    composition,
+    composition_many,
+    hill,
+    hill_many,
+    weight,
+    weight_many,
+)
+
+# pytest fixtures
+
+
+@pytest.fixture
+def formulas():
+    return ["C8H10N4O2", "((CH3)3N)(C6H11O2)", "[Cu(NH3)4]SO4 * H2O", "HC(C6H5)3", "H2O", ""]
+
+
+# Tests for functionality
+
+
+def test_composition(formulas):
+    for formula in formulas:
+        assert composition(formula) == ChemFormula(formula).element
+    assert list(composition("CH3CH2OH")) == ["C", "H", "O"]
+
+
+def test_hill(formulas):
+    for formula in formulas:
+        assert hill(formula) == str(ChemFormula(formula).hill_formula)
+
+
+@pytest.mark.parametrize(
+    "formula, charge, hill_formula",
+    [
+        ("SO4", -2, "O4S 2-"),
+        ("NH4", 1, "H4N +"),
+        ("CH3COO", -1, "C2H3O2 -"),
+        ("H2O", 0, "H2O"),
+    ],
+)
+def test_hill_charged(formula, charge, hill_formula):
+    assert hill(formula, charge) == hill_formula == ChemFormula(formula, charge).hill_formula.text_formula
+
+
+def test_weight(formulas):
+    for formula in formulas:
+        assert weight(formula) == ChemFormula(formula).formula_weight
+    assert isinstance(weight(""), float)
+
+
+def test_many(formulas):
+    assert composition_many(formulas) == [ChemFormula(formula).element for formula in formulas]
+    assert hill_many(formulas) == [str(ChemFormula(formula).hill_formula) for formula in formulas]
+    assert hill_many(["SO4"], charge=-2) == ["O4S 2-"]
+    assert weight_many(formulas) == [ChemFormula(formula).formula_weight for formula in formulas]
+    assert weight_many(iter(formulas)) == weight_many(formulas)
+
+
+# Tests for failure
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_formula():
+    weight("H2)O")
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_formula_many():
+    hill_many(["H2O", "Xy"])
+
+
+@pytest.mark.xfail(raises=TypeError)
+def test_invalid_charge():
+    hill("SO4", "2-")
@@ -1,6 +1,6 @@
 import pytest
 
-from chemformula import ChemFormula
+from chemformula import ChemFormula, render_many
 
 # pytest fixtures
 
@@ -130,6 +130,37 @@ def test_hill_formula(testinput, expected):
     assert str(testinput.hill_formula) == expected
 
 
+@pytest.mark.parametrize(
+    "testinput, expected",
+    [
+        (ChemFormula("[Cu(NH3)4]SO4.H2O"), {"Cu": 1, "N": 4, "H": 14, "S": 1, "O": 5}),
+        (ChemFormula("Ca(UO2)2(SiO3OH)2.(H2O)5"), {"Ca": 1, "U": 2, "O": 17, "Si": 2, "H": 12}),
+        (ChemFormula("{[(CH2)2]3}2"), {"C": 12, "H": 24}),
+        (ChemFormula("K4[Fe(CN)6]"), {"K": 4, "Fe": 1, "C": 6, "N": 6}),
+    ],
+)
+def test_element_bracket_resolution(testinput, expected):
+    assert testinput.element == expected
+
+
+def test_element_dictionary_is_a_copy(tetraamminecoppersulfate):
+    tetraamminecoppersulfate.element["Cu"] = 2
+    assert tetraamminecoppersulfate.element["Cu"] == 1
+    assert round(tetraamminecoppersulfate.formula_weight, 2) == 245.74
+
+
+def test_compact_layout(tetraamminecoppersulfate):
+    assert not hasattr(tetraamminecoppersulfate, "__dict__")
+    assert not hasattr(tetraamminecoppersulfate.hill_formula, "__dict__")
+    assert tetraamminecoppersulfate.name == "None"
+
+
+def test_deeply_nested_formula():
+    depth = 5000
+    formula = ChemFormula("(" * depth + "CH2" + ")1" * depth)
+    assert formula.element == {"C": 1, "H": 2}
+
+
 # Tests for output functionality
 
 
@@ -182,6 +213,28 @@ def test_hill_formula_text_formula(testinput, expected):
     assert testinput.hill_formula.text_formula == expected
 
 
+def test_render_many(muscarine):
+    formulas = [muscarine, ChemFormula("SO4", charge=-2), "H2O"]
+    assert render_many(formulas) == [formula.html for formula in formulas[:2]] + [
+        "<span class='ChemFormula'>H<sub>2</sub>O</span>"
+    ]
+    assert render_many(formulas, "unicode") == [
+        "((CH₃)₃N)(C₆H₁₁O₂)⁺",
+        "SO₄²⁻",
+        "H₂O",
+    ]
+
+
+def test_render_many_outputs(tetraamminecoppersulfate):
+    assert render_many([tetraamminecoppersulfate], ("text", "latex", "unicode")) == [
+        (
+            "[Cu(NH3)4]SO4.H2O",
+            r"\[\textnormal{Cu}\(\textnormal{N}\textnormal{H}_{3}\)_{4}\]\textnormal{S}\textnormal{O}_{4}\cdot\textnormal{H}_{2}\textnormal{O}",  # noqa: E501
+            "[Cu(NH₃)₄]SO₄.H₂O",
+        )
+    ]
+
+
 # Tests for error handling
 
 
@@ -208,3 +261,18 @@ def test_element():
 @pytest.mark.xfail(raises=ValueError)
 def test_unknown_element():
     ChemFormula("XyO")
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_brackets_closing_before_opening():
+    ChemFormula("H2)(O")
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_character():
+    ChemFormula("H2O+")
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_render_many_output():
+    render_many(["H2O"], "markdown")
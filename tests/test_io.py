@@ -0,0 +1,119 @@
+import io
+import json
+
+import pytest
+
+from chemformula import ChemFormula
+from chemformula.io import enrich, read_csv, read_jsonl, write_csv, write_jsonl
+
+# pytest fixtures
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "formulas.csv"
+    path.write_text(
+        "formula,charge,name,cas\n"
+        "C8H10N4O2,,caffeine,58-08-2\n"
+        '"((CH3)3N)(C6H11O2)",1,muscarine,\n'
+        "XyO,0,,\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def jsonl_file(tmp_path):
+    path = tmp_path / "formulas.jsonl"
+    path.write_text(
+        '{"formula": "SO4", "charge": -2, "name": "sulfate"}\n'
+        "\n"
+        '{"formula": "H2O", "cas": "64-17-6"}\n',
+        encoding="utf-8",
+    )
+    return path
+
+
+# Tests for functionality
+
+
+def test_read_csv(csv_file):
+    records = list(read_csv(csv_file))
+    assert [record["formula"] for record in records] == [
+        "C8H10N4O2",
+        "((CH3)3N)(C6H11O2)",
+        "XyO",
+    ]
+
+
+def test_read_jsonl(jsonl_file):
+    records = list(read_jsonl(jsonl_file))
+    assert records[0] == {"formula": "SO4", "charge": -2, "name": "sulfate"}
+    assert len(records) == 2
+
+
+def test_enrich(csv_file):
+    caffeine, muscarine, invalid = enrich(read_csv(csv_file))
+    assert caffeine["hill_formula"] == "C8H10N4O2"
+    assert caffeine["formula_weight"] == ChemFormula("C8H10N4O2").formula_weight
+    assert round(caffeine["mass_fraction"]["N"] * 100, 2) == 28.85
+    assert caffeine["name"] == "caffeine"
+    assert caffeine["error"] is None
+    assert muscarine["html"] == ChemFormula("((CH3)3N)(C6H11O2)", 1).html
+    assert invalid["hill_formula"] is None
+    assert invalid["error"] == "Invalid Element Symbol (unknown element symbol 'Xy')"
+
+
+def test_enrich_invalid_cas(jsonl_file):
+    sulfate, water = enrich(read_jsonl(jsonl_file))
+    assert sulfate["latex"] == ChemFormula("SO4", -2).latex
+    assert water["error"].startswith("Invalid CAS number")
+
+
+def test_enrich_missing_formula():
+    missing, water = enrich([{"name": "no formula"}, {"formula": "H2O"}])
+    assert missing["error"] == "Invalid Record (no formula field)"
+    assert missing["hill_formula"] is None
+    assert water["error"] is None
+
+
+@pytest.mark.parametrize(
+    "charge, expected",
+    [
+        ("-2", -2),
+        (1, 1),
+        ("", 0),
+        (None, 0),
+        (1.5, "Invalid Charge Value '1.5'"),
+        (True, "Invalid Charge Value 'True'"),
+        ("1.5", "Invalid Charge Value '1.5'"),
+    ],
+)
+def test_enrich_charge(charge, expected):
+    (record,) = enrich([{"formula": "SO4", "charge": charge}])
+    if isinstance(expected, int):
+        assert record["error"] is None
+        assert record["html"] == ChemFormula("SO4", expected).html
+    else:
+        assert record["error"].startswith(expected)
+
+
+def test_enrich_is_lazy():
+    records = enrich({"formula": "H2O"} for _ in range(10**12))
+    assert next(records)["hill_formula"] == "H2O"
+
+
+def test_write_csv(csv_file, tmp_path):
+    target = tmp_path / "enriched.csv"
+    assert write_csv(enrich(read_csv(csv_file)), target) == 3
+    records = list(read_csv(target))
+    assert records[0]["hill_formula"] == "C8H10N4O2"
+    assert json.loads(records[0]["mass_fraction"])["O"] > 0
+    assert records[2]["error"].startswith("Invalid Element Symbol")
+
+
+def test_write_jsonl(jsonl_file):
+    target = io.StringIO()
+    assert write_jsonl(enrich(read_jsonl(jsonl_file)), target) == 2
+    records = [json.loads(line) for line in target.getvalue().splitlines()]
+    assert records[0]["hill_formula"] == "O4S"
@@ -0,0 +1,108 @@
+import pytest
+
+from chemformula import ChemFormula, elements, isotope_patterns
+from chemformula.isotopes import isotope_pattern, isotope_table
+
+# pytest fixtures
+
+
+@pytest.fixture
+def glucose():
+    return ChemFormula("C6H12O6")
+
+
+@pytest.fixture
+def insulin():
+    return ChemFormula("C254H377N65O75S6")
+
+
+# Tests for functionality
+
+
+def test_isotope_table():
+    for element, isotopes in isotope_table.items():
+        assert sum(abundance for _, _, abundance in isotopes) == pytest.approx(1.0, abs=2e-4)
+        average_mass = sum(mass * abundance for _, mass, abundance in isotopes)
+        assert average_mass == pytest.approx(elements.atomic_weight(element), abs=0.02)
+
+
+@pytest.mark.parametrize(
+    "testinput, expected",
+    [
+        (ChemFormula("H2O"), 18.010565),
+        (ChemFormula("C6H12O6"), 180.063388),
+        (ChemFormula("CH3Cl"), 49.992328),
+    ],
+)
+def test_monoisotopic_mass(testinput, expected):
+    assert testinput.monoisotopic_mass == pytest.approx(expected, abs=1e-6)
+
+
+def test_aggregated_pattern(glucose):
+    pattern = glucose.isotope_pattern()
+    assert pattern[0][0] == pytest.approx(glucose.monoisotopic_mass)
+    assert [round(mass) for mass, _ in pattern[:3]] == [180, 181, 182]
+    assert pattern[0][1] == pytest.approx(0.9226, abs=1e-4)
+    assert sum(probability for _, probability in pattern) == pytest.approx(1.0, abs=1e-5)
+
+
+def test_chlorine_pattern():
+    pattern = isotope_pattern({"Cl": 2})
+    assert [probability for _, probability in pattern] == pytest.approx([0.7576 ** 2, 2 * 0.7576 * 0.2424, 0.2424 ** 2])
+
+
+def test_fine_pattern():
+    fine_pattern = isotope_pattern({"C": 1, "H": 3, "Br": 1}, fine=True, threshold=1e-3)
+    assert len(fine_pattern) == 4
+    assert len(isotope_pattern({"C": 1, "H": 3, "Br": 1}, threshold=1e-3)) == 4
+    assert len(isotope_pattern({"C": 1, "H": 3, "Br": 1}, threshold=5e-2)) == 2
+
+
+def test_large_formula(insulin):
+    pattern = insulin.isotope_pattern()
+    most_intense = max(pattern, key=lambda peak: peak[1])
+    assert round(most_intense[0]) == 5733
+    average_mass = sum(mass * probability for mass, probability in pattern) / sum(probability for _, probability in pattern)
+    assert average_mass == pytest.approx(insulin.formula_weight, abs=0.1)
+
+
+@pytest.mark.parametrize(
+    "testinput, expected",
+    [
+        (ChemFormula("PbCl2"), 277.914357),
+        (ChemFormula("BaSO4"), 233.856977),
+        (ChemFormula("Gd2O3"), 363.832952),
+        (ChemFormula("UO2"), 270.040617),
+    ],
+)
+def test_heavy_elements(testinput, expected):
+    assert testinput.monoisotopic_mass == pytest.approx(expected, abs=1e-6)
+
+
+def test_lead_pattern():
+    pattern = isotope_pattern({"Pb": 1})
+    assert [round(mass) for mass, _ in pattern] == [204, 206, 207, 208]
+    assert [probability for _, probability in pattern] == pytest.approx([0.014, 0.241, 0.221, 0.524])
+
+
+def test_charged_pattern():
+    assert ChemFormula("SO4", charge=-2).isotope_pattern()[0][0] == pytest.approx(95.95 / 2, abs=0.01)
+
+
+def test_isotope_patterns(glucose, insulin):
+    patterns = isotope_patterns([glucose, insulin, {"Cl": 2}])
+    assert patterns == [glucose.isotope_pattern(), insulin.isotope_pattern(), isotope_pattern({"Cl": 2})]
+
+
+# Tests for failure
+
+
+@pytest.mark.xfail(raises=ValueError)
+@pytest.mark.parametrize("formula", ["TcO4", "PmCl3", "PuO2", "RnF2"])
+def test_missing_isotope_data(formula):
+    assert ChemFormula(formula).monoisotopic_mass
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_threshold(glucose):
+    glucose.isotope_pattern(threshold=1.5)
@@ -0,0 +1,65 @@
+import pytest
+
+from chemformula import (
+    ChemFormula,
+    disable_parse_cache,
+    enable_parse_cache,
+    parse_cache_info,
+)
+
+# pytest fixtures
+
+
+@pytest.fixture
+def lazy_muscarine():
+    return ChemFormula("((CH3)3N)(C6H11O2)", charge=1, name="ʟ-(+)-Muscarine", lazy=True)
+
+
+# Tests for functionality
+
+
+def test_lazy_properties(lazy_muscarine):
+    eager_muscarine = ChemFormula("((CH3)3N)(C6H11O2)", charge=1)
+    assert lazy_muscarine.name == "ʟ-(+)-Muscarine"
+    assert lazy_muscarine.html == eager_muscarine.html
+    assert lazy_muscarine.element == eager_muscarine.element
+    assert str(lazy_muscarine.hill_formula) == "C9H20NO2"
+    assert lazy_muscarine.formula_weight == eager_muscarine.formula_weight
+    assert lazy_muscarine == eager_muscarine
+    assert hash(lazy_muscarine) == hash(eager_muscarine)
+
+
+def test_parsed_on_first_access():
+    enable_parse_cache()
+    try:
+        lazy_water = ChemFormula("H2O", lazy=True)
+        assert parse_cache_info().misses == 0
+        assert lazy_water.unicode == "H₂O"
+        assert parse_cache_info().misses == 0
+        assert lazy_water.formula_weight == pytest.approx(18.015)
+        assert parse_cache_info().misses == 1
+    finally:
+        disable_parse_cache()
+
+
+def test_validate(lazy_muscarine):
+    assert lazy_muscarine.validate() is lazy_muscarine
+    assert ChemFormula("H2O").validate().formula == "H2O"
+
+
+def test_invalid_formula_is_not_parsed():
+    invalid_formula = ChemFormula("H2Xy", lazy=True)
+    assert invalid_formula.formula == "H2Xy"
+
+
+# Tests for failure
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_validate_invalid_formula():
+    ChemFormula("H2Xy", lazy=True).validate()
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_access_invalid_formula():
+    assert ChemFormula("(H2O", lazy=True).element
@@ -0,0 +1,83 @@
+import pytest
+
+from chemformula import ChemFormula, FormulaMassIndex
+
+# pytest fixtures
+
+
+@pytest.fixture
+def mass_index():
+    return FormulaMassIndex([
+        "C6H12O6",
+        ChemFormula("C12H22O11", name="Sucrose"),
+        "H2O",
+        ChemFormula("SO4", charge=-2),
+        "C8H10N4O2",
+    ])
+
+
+# Tests for functionality
+
+
+def test_len_and_order(mass_index):
+    assert len(mass_index) == 5
+    assert list(mass_index.masses) == sorted(mass_index.masses)
+    assert [str(formula) for formula in mass_index.formulas] == ["H2O", "SO4", "C6H12O6", "C8H10N4O2", "C12H22O11"]
+
+
+def test_mass_to_charge(mass_index):
+    assert mass_index.masses[1] == pytest.approx(ChemFormula("SO4").formula_weight / 2)
+
+
+@pytest.mark.parametrize(
+    "mass, ppm, expected",
+    [
+        (180.156, 5, ["C6H12O6"]),
+        (180.2, 5, []),
+        (180.2, 500, ["C6H12O6"]),
+        (48.028, 10, ["SO4"]),
+        (0.0, 5, []),
+    ],
+)
+def test_query(mass_index, mass, ppm, expected):
+    assert [str(formula) for formula in mass_index.query(mass, ppm)] == expected
+
+
+def test_query_returns_objects(mass_index):
+    assert mass_index.query(342.297, ppm=1)[0].name == "Sucrose"
+
+
+def test_query_many(mass_index):
+    masses = [342.297, 18.015, 1000.0, 194.194, 18.015]
+    assert [[str(formula) for formula in result] for result in mass_index.query_many(masses, ppm=5)] == [
+        ["C12H22O11"], ["H2O"], [], ["C8H10N4O2"], ["H2O"],
+    ]
+
+
+def test_query_many_wide_window(mass_index):
+    assert mass_index.query_many([180.156, 18.015], ppm=2_000_000) == [
+        mass_index.query(180.156, ppm=2_000_000), mass_index.query(18.015, ppm=2_000_000),
+    ]
+
+
+def test_masses_read_only(mass_index):
+    with pytest.raises(TypeError):
+        mass_index.masses[0] = 1.0
+
+
+# Tests for failure
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_negative_ppm(mass_index):
+    mass_index.query(18.015, ppm=-1)
+
+
+@pytest.mark.xfail(raises=TypeError)
+def test_invalid_ppm(mass_index):
+    mass_index.query_many([18.015], ppm="5")
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_formula():
+    FormulaMassIndex(["H2O", "Xy"])
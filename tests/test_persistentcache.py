@@ -0,0 +1,82 @@
+import sqlite3
+
+import pytest
+
+from chemformula import elements
+from chemformula.bulk import parse_bulk
+from chemformula.persistentcache import PersistentParseCache
+
+# pytest fixtures
+
+
+@pytest.fixture
+def formulas():
+    return ["C8H10N4O2", "XyO", "((CH3)3N)(C6H11O2)", "H2)O", "CaCO3", "H2O", "H2O"] * 3
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "parse_cache.sqlite"
+
+
+# Tests for functionality
+
+
+def test_parse(cache_path, formulas):
+    expected = list(parse_bulk(formulas, jobs=1))
+    with PersistentParseCache(cache_path) as cache:
+        assert cache.parse(formulas) == expected
+        assert len(cache) == 6
+        assert (cache.hits, cache.misses) == (0, 6)
+        assert cache.parse(formulas) == expected
+        assert (cache.hits, cache.misses) == (6, 6)
+
+
+def test_get(cache_path):
+    with PersistentParseCache(cache_path) as cache:
+        assert cache.get("H2O") is None
+        (result,) = cache.parse(["H2O"])
+        assert cache.get("H2O") == result
+        assert cache.get_many(["H2O", "CO2"]) == {"H2O": result}
+        cache.clear()
+        assert len(cache) == 0
+
+
+def test_persistence(cache_path, formulas):
+    with PersistentParseCache(cache_path) as cache:
+        cache.parse(formulas)
+    with PersistentParseCache(cache_path) as cache:
+        assert len(cache.get_many(formulas)) == 6
+        assert cache.misses == 0
+
+
+def test_invalidation(cache_path, formulas, monkeypatch):
+    with PersistentParseCache(cache_path) as cache:
+        cache.parse(formulas)
+    monkeypatch.setattr(elements, "element_table_checksum", lambda: 0)
+    with PersistentParseCache(cache_path) as cache:
+        assert len(cache) == 0
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_parse_bulk(cache_path, formulas, jobs):
+    expected = list(parse_bulk(formulas, jobs=1))
+    assert list(parse_bulk(formulas, jobs=jobs, chunksize=4, cache=cache_path)) == expected
+    with PersistentParseCache(cache_path) as cache:
+        assert len(cache) == 6
+    assert list(parse_bulk(formulas, jobs=jobs, chunksize=4, cache=cache_path)) == expected
+
+
+def test_empty_formula(cache_path):
+    with PersistentParseCache(cache_path) as cache:
+        cache.parse([""])
+        assert cache.get("") == next(parse_bulk([""], jobs=1))
+
+
+# Tests for failure
+
+
+@pytest.mark.xfail(raises=sqlite3.DatabaseError)
+def test_invalid_cache_file(cache_path):
+    cache_path.write_text("no database", encoding="utf-8")
+    PersistentParseCache(cache_path)
@@ -0,0 +1,58 @@
+import pytest
+
+from chemformula import ChemFormula, profiling
+
+# pytest fixtures
+
+
+@pytest.fixture
+def enabled_profiling():
+    profiling.reset()
+    profiling.enable()
+    yield
+    profiling.disable()
+    profiling.reset()
+
+
+# Tests for functionality
+
+
+def test_disabled_by_default():
+    profiling.reset()
+    assert ChemFormula("H2O").html == "<span class='ChemFormula'>H<sub>2</sub>O</span>"
+    assert profiling.snapshot() == {}
+
+
+def test_stage_counters(enabled_profiling):
+    water = ChemFormula("H2O")
+    assert water.formula_weight == water.formula_weight  # memoized, recorded only once
+    assert water.html == water.html
+    snapshot = profiling.snapshot()
+    assert snapshot["parse"]["calls"] == 1
+    assert snapshot["formula_weight"]["calls"] == 1
+    assert snapshot["html"]["calls"] == 2
+    assert snapshot["html"]["seconds"] >= 0.0
+    assert "latex" not in snapshot
+
+
+def test_parse_errors(enabled_profiling):
+    with pytest.raises(ValueError):
+        ChemFormula("XyZ")
+    snapshot = profiling.snapshot()
+    assert snapshot["parse_error"]["calls"] == 1
+    assert "parse" not in snapshot
+
+
+def test_prometheus(enabled_profiling):
+    assert ChemFormula("H2O").unicode == "H₂O"
+    text = profiling.prometheus()
+    assert "# TYPE chemformula_stage_calls_total counter" in text
+    assert 'chemformula_stage_calls_total{stage="parse"} 1' in text
+    assert 'chemformula_stage_calls_total{stage="unicode"} 1' in text
+    assert 'chemformula_stage_seconds_total{stage="unicode"} ' in text
+
+
+def test_reset(enabled_profiling):
+    ChemFormula("H2O")
+    profiling.reset()
+    assert profiling.snapshot() == {}
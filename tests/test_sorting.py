@@ -74,8 +74,81 @@ def test_for_lesser_than(testinput_left, testinput_right):
     assert testinput_left < testinput_right
 
 
+def test_for_unequal_charge():
+    assert ChemFormula("H3O", charge=1) != ChemFormula("H3O")
+
+
+def test_for_unequal_cas(caffeine):
+    assert caffeine != ChemFormula("C8H10N4O2")
+
+
+def test_for_unequal_type(caffeine):
+    assert caffeine != "C8H10N4O2"
+
+
+@pytest.mark.parametrize(
+    "testinput_left, testinput_right",
+    [
+        (ChemFormula("H0"), ChemFormula("")),
+        (ChemFormula("CH4O0"), ChemFormula("CH4")),
+        (ChemFormula("C0H4Si"), ChemFormula("H4Si")),
+    ],
+)
+def test_for_equal_zero_frequency(testinput_left, testinput_right):
+    assert testinput_left == testinput_right
+    assert hash(testinput_left) == hash(testinput_right)
+    assert testinput_left.hill_sort_key == testinput_right.hill_sort_key
+    assert testinput_left <= testinput_right and testinput_left >= testinput_right
+
+
+# Tests for hashing functionality
+
+
+def test_hash(caffeine, theine):
+    assert hash(caffeine) == hash(theine)
+
+
+def test_set_deduplication(caffeine, theine, l_lacticacid, d_lacticacid):
+    formulas = {caffeine, theine, l_lacticacid, d_lacticacid}
+    assert len(formulas) == 3
+
+
+def test_dictionary_key(caffeine, theine):
+    names = {caffeine: caffeine.name}
+    assert names[theine] == "caffeine"
+
+
+@pytest.mark.parametrize("attribute", ["formula", "charge", "cas"])
+def test_immutable(caffeine, attribute):
+    with pytest.raises(AttributeError):
+        setattr(caffeine, attribute, None)
+
+
+@pytest.mark.parametrize(
+    "testinput_left, testinput_right",
+    [
+        (ChemFormula("CO2"), ChemFormula("Al2O3")),
+        (ChemFormula("C3H4"), ChemFormula("C2H4")),
+        (ChemFormula("C2H4O"), ChemFormula("C2H4")),
+    ],
+)
+def test_for_greater_than(testinput_left, testinput_right):
+    assert testinput_left > testinput_right
+    assert testinput_left >= testinput_right
+    assert not testinput_left <= testinput_right
+
+
+def test_hill_sort_key():
+    assert ChemFormula("CaCO3").hill_sort_key == (("c", 1), ("ca", 1), ("o", 3))
+
+
 # Test for sorting functionality
 
 
 def test_for_sorting(hydrocarbons, hydrocarbons_sorted):
     assert sorted(hydrocarbons) == hydrocarbons_sorted
+
+
+def test_for_sorting_by_key(hydrocarbons, hydrocarbons_sorted):
+    sorted_formulas = sorted(hydrocarbons, key=lambda formula: formula.hill_sort_key)
+    assert sorted_formulas == hydrocarbons_sorted
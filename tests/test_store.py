@@ -0,0 +1,108 @@
+import struct
+
+import pytest
+
+from chemformula import ChemFormula
+from chemformula.store import FormulaStore, write_store
+
+# pytest fixtures
+
+
+@pytest.fixture
+def formulas():
+    return [
+        ChemFormula("C8H10N4O2", name="caffeine", cas="58-08-2"),
+        ChemFormula("SO4", charge=-2, name="Sulfat"),
+        ChemFormula("[Cu(NH3)4]SO4.H2O"),
+        "(CH3)2CHOH",
+    ]
+
+
+@pytest.fixture
+def store_path(tmp_path, formulas):
+    path = tmp_path / "formulas.cfs"
+    assert write_store(formulas, path) == 4
+    return path
+
+
+# Tests for functionality
+
+
+def test_round_trip(store_path, formulas):
+    with FormulaStore(store_path) as store:
+        assert len(store) == 4
+        assert [store[position] for position in range(4)] == [
+            formula if isinstance(formula, ChemFormula) else ChemFormula(formula) for formula in formulas
+        ]
+        assert store[-1] == ChemFormula("C3H8O")
+
+
+def test_columns(store_path):
+    with FormulaStore(store_path) as store:
+        assert list(store.charges) == [0, -2, 0, 0]
+        assert store.formula_weights[0] == ChemFormula("C8H10N4O2").formula_weight
+        assert list(store.hill_ranks) == [1, 3, 2, 0]
+
+
+def test_strings(store_path):
+    with FormulaStore(store_path) as store:
+        assert store.hill_formula(2) == "CuH14N4O5S"
+        assert store.element(0) == {"C": 8, "H": 10, "N": 4, "O": 2}
+        assert store.name(1) == "Sulfat"
+        assert store.name(2) is None
+        assert store.cas(0) == "58-08-2"
+        assert store.cas(1) is None
+        caffeine = store[0]
+        assert caffeine.name == "caffeine"
+        assert caffeine.cas.cas_integer == 58082
+        assert str(caffeine) == "C8H10N4O2"
+
+
+def test_empty_store(tmp_path):
+    path = tmp_path / "empty.cfs"
+    write_store([], path)
+    with FormulaStore(path) as store:
+        assert len(store) == 0
+        assert list(store.formula_weights) == []
+
+
+def test_close_with_views_in_use(store_path, formulas):
+    numpy = pytest.importorskip("numpy")
+    store = FormulaStore(store_path)
+    weights = store.formula_weights[1:3]
+    array = numpy.asarray(store.formula_weights)
+    charges = store.charges
+    store.close()
+    store.close()
+    assert list(weights) == [ChemFormula(formula).formula_weight for formula in formulas[1:3]]
+    assert array[0] == formulas[0].formula_weight
+    assert list(charges) == [0, -2, 0, 0]
+
+
+# Tests for failure
+
+
+@pytest.mark.xfail(raises=IndexError)
+def test_invalid_position(store_path):
+    with FormulaStore(store_path) as store:
+        store.name(4)
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_file(tmp_path):
+    path = tmp_path / "invalid.cfs"
+    path.write_bytes(b"H2O\n" * 100)
+    FormulaStore(path)
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_version(store_path):
+    data = bytearray(store_path.read_bytes())
+    struct.pack_into("<I", data, 8, 99)
+    store_path.write_bytes(bytes(data))
+    FormulaStore(store_path)
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_invalid_charge(tmp_path):
+    write_store([ChemFormula("SO4", charge=-2**31 - 1)], tmp_path / "charge.cfs")
@@ -0,0 +1,70 @@
+import pytest
+
+from chemformula import ChemFormula, FormulaError, validate_many
+from chemformula.parser import ERROR_MESSAGES
+
+# pytest fixtures
+
+
+@pytest.fixture
+def formulas():
+    return ["C8H10N4O2", "Na Cl . Xy", "H2)O", "((CH3)3N", "CaCO3", "Caa", "H2O!"]
+
+
+# Tests for functionality
+
+
+def test_valid_formulas():
+    assert validate_many(["C8H10N4O2", "((CH3)3N)(C6H11O2)", "[Cu(NH3)4]SO4 * H2O", ""]) == [None] * 4
+
+
+def test_error_reports(formulas):
+    assert validate_many(formulas) == [
+        None,
+        FormulaError("unknown_element", 8, "Xy", "Invalid Element Symbol (unknown element symbol 'Xy')"),
+        FormulaError("unexpected_closing_bracket", 2, ")", ERROR_MESSAGES["unexpected_closing_bracket"]),
+        FormulaError("unbalanced_brackets", 0, "(", ERROR_MESSAGES["unbalanced_brackets"]),
+        None,
+        FormulaError("double_lowercase", 0, "Caa", ERROR_MESSAGES["double_lowercase"]),
+        FormulaError("invalid_character", 3, "!", "Invalid Character in Formula (unexpected character '!')"),
+    ]
+
+
+def test_boolean_mode(formulas):
+    assert validate_many(formulas, details=False) == [True, False, False, False, True, False, False]
+
+
+@pytest.mark.parametrize(
+    "formula",
+    ["Xy", "H2)O", "((CH3)3N", "Caa", "H2O!", "aaH"],
+)
+def test_error_messages_match_constructor(formula):
+    (error,) = validate_many([formula])
+    with pytest.raises(ValueError) as exc_info:
+        ChemFormula(formula)
+    assert error.message == str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "formula, kind",
+    [
+        ("(XyO", "unbalanced_brackets"),
+        ("XyCaa", "double_lowercase"),
+        ("Caa)", "unexpected_closing_bracket"),
+        ("H2O!Xy", "unknown_element"),
+        ("Xy)(O", "unexpected_closing_bracket"),
+    ],
+)
+def test_error_priority(formula, kind):
+    (error,) = validate_many([formula])
+    assert error.kind == kind
+
+
+def test_position_in_original_formula():
+    (error,) = validate_many(["C H 3 * Qq"])
+    assert error.position == 8
+    assert "C H 3 * Qq"[error.position:error.position + len(error.token)].replace(" ", "") == error.token
+
+
+def test_chemical_formula_objects():
+    assert validate_many([ChemFormula("H2O")]) == [None]